@@ -0,0 +1,59 @@
+import json
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from vibeweb import jsonio
+
+EXAMPLES = Path(__file__).resolve().parent.parent / "examples"
+
+
+class TestJsonio(unittest.TestCase):
+    def _both_backends(self, raw):
+        fast = jsonio.loads(raw)
+        with mock.patch.object(jsonio, "orjson", None):
+            slow = jsonio.loads(raw)
+        return fast, slow
+
+    def test_backends_agree_on_example_specs(self) -> None:
+        files = sorted(EXAMPLES.rglob("*.vweb.json"))
+        self.assertTrue(files)
+        for path in files:
+            raw = path.read_bytes()
+            fast, slow = self._both_backends(raw)
+            self.assertEqual(fast, slow, path.name)
+            self.assertEqual(fast, json.loads(raw.decode("utf-8")), path.name)
+
+    def test_str_and_bytes(self) -> None:
+        self.assertEqual(jsonio.loads('{"a": [1, "é"]}'), {"a": [1, "é"]})
+        self.assertEqual(jsonio.loads('{"a": [1, "é"]}'.encode("utf-8")), {"a": [1, "é"]})
+
+    def test_long_ints_stay_exact(self) -> None:
+        for raw in (b"[12345678901234567890123]", "[12345678901234567890123]"):
+            fast, slow = self._both_backends(raw)
+            self.assertEqual(fast, [12345678901234567890123])
+            self.assertEqual(slow, fast)
+
+    def test_invalid_raises_value_error(self) -> None:
+        for raw in (b"{bad", "{bad"):
+            with self.assertRaises(ValueError):
+                jsonio.loads(raw)
+
+    def test_dumps_compact(self) -> None:
+        self.assertEqual(jsonio.dumps({"a": [1, "é"]}), '{"a":[1,"é"]}'.encode("utf-8"))
+        with mock.patch.object(jsonio, "orjson", None):
+            self.assertEqual(jsonio.dumps({"a": [1, "é"]}), '{"a":[1,"é"]}'.encode("utf-8"))
+
+    def test_dumps_non_finite_floats_are_null(self) -> None:
+        data = {"a": float("nan"), "b": [float("inf"), -float("inf")], "c": 1e16, "d": (1.5,)}
+        fast = jsonio.dumps(data)
+        with mock.patch.object(jsonio, "orjson", None):
+            slow = jsonio.dumps(data)
+        self.assertEqual(slow, b'{"a":null,"b":[null,null],"c":1e+16,"d":[1.5]}')
+        # Float spelling may differ (1e16 vs 1e+16); both must be valid JSON with the same value.
+        self.assertEqual(json.loads(fast), json.loads(slow))
+        self.assertEqual(json.loads(slow), {"a": None, "b": [None, None], "c": 1e16, "d": [1.5]})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,269 @@
+import gzip
+import http.client
+import json
+import random
+import socket
+import sqlite3
+import tempfile
+import threading
+import time
+import unittest
+from pathlib import Path
+
+from vibeweb.server import Handler, VibeWebServer, _WorkerPoolHTTPServer
+from vibeweb.spec import validate_spec
+
+
+def _app_spec(db_path: str) -> dict:
+    return {
+        "name": "Test App",
+        "db": {"path": db_path, "models": [{"name": "Todo", "fields": {"title": "text", "note": "text"}}]},
+        "api": {
+            "crud": ["Todo"],
+            "actions": [
+                {
+                    "name": "annotate",
+                    "kind": "value",
+                    "path": "/api/actions/annotate",
+                    "auth": "api",
+                    "value": {"data": {"note": "hooked"}},
+                }
+            ],
+            "hooks": [
+                {
+                    "model": "Todo",
+                    "event": "after_create",
+                    "action": "annotate",
+                    "mode": "async",
+                    "when": {"title": "hooked-row"},
+                    "writeback": ["note"],
+                }
+            ],
+        },
+        "ui": {"admin": True, "admin_path": "/admin"},
+    }
+
+
+class ServerTestCase(unittest.TestCase):
+    def setUp(self) -> None:
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.db_path = str(Path(tmp.name) / "app.db")
+        self.ctx = VibeWebServer(validate_spec(_app_spec(self.db_path)))
+        self.ctx.audit_log_path = ""
+        self.addCleanup(self.ctx.close)
+        handler = type("TestHandler", (Handler,), {"server_ctx": self.ctx, "log_message": lambda *args: None})
+        self.httpd = _WorkerPoolHTTPServer(("127.0.0.1", 0), handler, max_threads=4)
+        thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        thread.start()
+        self.addCleanup(self.httpd.server_close)
+        self.addCleanup(self.httpd.shutdown)
+
+    def request(self, method: str, path: str, body=None, headers=None) -> tuple[int, dict[str, str], bytes]:
+        conn = http.client.HTTPConnection("127.0.0.1", self.httpd.server_address[1], timeout=10)
+        try:
+            headers = dict(headers or {})
+            if body is not None:
+                body = json.dumps(body).encode("utf-8")
+                headers["Content-Type"] = "application/json"
+            conn.request(method, path, body=body, headers=headers)
+            resp = conn.getresponse()
+            return resp.status, {k.lower(): v for k, v in resp.getheaders()}, resp.read()
+        finally:
+            conn.close()
+
+    def admin_list(self) -> str:
+        status, _, body = self.request("GET", "/admin/Todo")
+        self.assertEqual(status, 200)
+        return body.decode("utf-8")
+
+
+class TestAdminRenderCache(ServerTestCase):
+    def test_api_writes_invalidate_cached_list(self) -> None:
+        status, _, body = self.request("POST", "/api/Todo", {"title": "first-title"})
+        self.assertEqual(status, 201)
+        row_id = json.loads(body)["id"]
+        self.assertIn("first-title", self.admin_list())
+        self.request("PUT", f"/api/Todo/{row_id}", {"title": "second-title"})
+        page = self.admin_list()
+        self.assertIn("second-title", page)
+        self.assertNotIn("first-title", page)
+        self.request("DELETE", f"/api/Todo/{row_id}")
+        self.assertNotIn("second-title", self.admin_list())
+
+    def test_admin_form_writes_invalidate_cached_list(self) -> None:
+        token = self.ctx.csrf_token
+        status, _, _ = self.request("POST", "/admin/Todo/create", {"title": "form-title", "csrf_token": token})
+        self.assertEqual(status, 303)
+        self.assertIn("form-title", self.admin_list())
+        row_id = self.ctx.conn.execute("SELECT id FROM Todo").fetchone()[0]
+        self.request("POST", f"/admin/Todo/{row_id}/update", {"title": "edited-title", "csrf_token": token})
+        self.assertIn("edited-title", self.admin_list())
+        self.request("POST", f"/admin/Todo/{row_id}/delete", {"csrf_token": token})
+        self.assertNotIn("edited-title", self.admin_list())
+
+    def test_hook_writeback_invalidates_cached_list(self) -> None:
+        self.request("POST", "/api/Todo", {"title": "hooked-row"})
+        # The async hook may land before or after this render; either way the page must catch up.
+        self.admin_list()
+        deadline = time.monotonic() + 5
+        while "hooked</td>" not in self.admin_list():
+            self.assertLess(time.monotonic(), deadline, "hook writeback never reached the admin list")
+            time.sleep(0.02)
+
+    def test_external_write_invalidates_cached_list(self) -> None:
+        self.assertNotIn("outside-title", self.admin_list())
+        other = sqlite3.connect(self.db_path)
+        with other:
+            other.execute("INSERT INTO Todo (title) VALUES ('outside-title')")
+        other.close()
+        self.assertIn("outside-title", self.admin_list())
+
+
+class TestReaderPool(ServerTestCase):
+    def test_read_after_write_sees_the_write(self) -> None:
+        self.assertTrue(self.ctx.readers)
+        # More rounds than pooled readers, so every reader serves a read right after a commit.
+        for i in range(len(self.ctx.readers) * 2):
+            status, _, body = self.request("POST", "/api/Todo", {"title": f"row-{i}"})
+            self.assertEqual(status, 201)
+            row_id = json.loads(body)["id"]
+            status, _, body = self.request("GET", f"/api/Todo/{row_id}")
+            self.assertEqual(status, 200)
+            self.assertEqual(json.loads(body)["title"], f"row-{i}")
+            _, _, body = self.request("GET", "/api/Todo?count=1")
+            self.assertEqual(json.loads(body)["count"], i + 1)
+
+
+class TestStatic(ServerTestCase):
+    def test_etag_and_not_modified(self) -> None:
+        status, headers, body = self.request("GET", "/static/style.css")
+        self.assertEqual(status, 200)
+        self.assertTrue(body)
+        etag = headers["etag"]
+        status, headers, body = self.request("GET", "/static/style.css", headers={"If-None-Match": etag})
+        self.assertEqual(status, 304)
+        self.assertEqual(headers["etag"], etag)
+        self.assertEqual(body, b"")
+        status, _, _ = self.request("GET", "/static/style.css", headers={"If-None-Match": '"stale"'})
+        self.assertEqual(status, 200)
+        status, _, _ = self.request("GET", "/static/../server.py")
+        self.assertEqual(status, 404)
+
+
+class TestGzip(ServerTestCase):
+    def test_admin_list_negotiates_gzip(self) -> None:
+        self.request("POST", "/api/Todo", {"title": "zip-me"})
+        _, headers, plain = self.request("GET", "/admin/Todo")
+        self.assertNotIn("content-encoding", headers)
+        self.assertEqual(headers["vary"], "Accept-Encoding")
+        self.assertIn(b"zip-me", plain)
+        # The second request is served from the render cache, which compresses once and keeps the result.
+        for _ in range(2):
+            _, headers, body = self.request("GET", "/admin/Todo", headers={"Accept-Encoding": "br, gzip"})
+            self.assertEqual(headers["content-encoding"], "gzip")
+            self.assertEqual(headers["vary"], "Accept-Encoding")
+            self.assertEqual(int(headers["content-length"]), len(body))
+            self.assertEqual(gzip.decompress(body), plain)
+        _, headers, body = self.request("GET", "/admin/Todo", headers={"Accept-Encoding": "gzip;q=0"})
+        self.assertNotIn("content-encoding", headers)
+        self.assertEqual(body, plain)
+
+
+class TestWorkerPool(ServerTestCase):
+    def idle_connections(self, count: int) -> None:
+        for _ in range(count):
+            sock = socket.create_connection(self.httpd.server_address, timeout=10)
+            self.addCleanup(sock.close)
+
+    def test_idle_connections_time_out_and_free_workers(self) -> None:
+        self.httpd.RequestHandlerClass.timeout = 0.5
+        self.idle_connections(len(self.httpd._workers))
+        started = time.monotonic()
+        status, _, _ = self.request("GET", "/healthz")
+        self.assertEqual(status, 200)
+        self.assertLess(time.monotonic() - started, 5)
+
+    def test_full_pool_rejects_without_blocking_accept(self) -> None:
+        self.httpd.RequestHandlerClass.timeout = 2
+        # Every worker busy and every hand-off slot taken.
+        self.idle_connections(len(self.httpd._workers) * 2)
+        with socket.create_connection(self.httpd.server_address, timeout=5) as sock:
+            self.assertTrue(sock.recv(4096).startswith(b"HTTP/1.0 503 "))
+        stopper = threading.Thread(target=self.httpd.shutdown)
+        stopper.start()
+        stopper.join(5)
+        self.assertFalse(stopper.is_alive(), "shutdown() hung behind idle connections")
+
+
+def _split_route(base: str, path: str, method: str) -> tuple:
+    """The split-based admin routing the admin_route regex replaced."""
+    parts = [p for p in path[len(base) :].lstrip("/").split("/") if p]
+    model = parts[0] if parts else None
+    if method == "GET":
+        return model, ("edit", parts[1]) if len(parts) == 2 else ("list",)
+    if len(parts) == 2 and parts[1] == "create":
+        return model, ("create",)
+    if len(parts) == 3 and parts[2] in ("update", "delete"):
+        return model, (parts[2], parts[1])
+    return model, ("other",)
+
+
+def _regex_route(route, path: str, method: str) -> tuple:
+    match = route.match(path)
+    if match is None:
+        return None, ("list",) if method == "GET" else ("other",)
+    model, raw_id, action, rest = match.groups()
+    if method == "GET":
+        return model, ("edit", raw_id) if raw_id is not None and action is None else ("list",)
+    if raw_id == "create" and action is None:
+        return model, ("create",)
+    if action in ("update", "delete") and not rest:
+        return model, (action, raw_id)
+    return model, ("other",)
+
+
+class TestAdminRouting(ServerTestCase):
+    def test_regex_matches_split_routing(self) -> None:
+        rng = random.Random(1015)
+        segments = ["Todo", "create", "update", "delete", "1", "x", ""]
+        for _ in range(5000):
+            path = "/admin/" + "".join(
+                rng.choice(segments) + "/" * rng.randint(1, 3) for _ in range(rng.randint(0, 5))
+            )
+            for method in ("GET", "POST"):
+                self.assertEqual(
+                    _regex_route(self.ctx.admin_route, path, method),
+                    _split_route("/admin", path, method),
+                    path,
+                )
+
+    def test_routes(self) -> None:
+        token = self.ctx.csrf_token
+        status, headers, _ = self.request("POST", "/admin//Todo//create", {"title": "routed", "csrf_token": token})
+        self.assertEqual(status, 303)
+        self.assertEqual(headers["location"], "/admin/Todo")
+        row_id = self.ctx.conn.execute("SELECT id FROM Todo").fetchone()[0]
+        cases = [
+            ("/admin", 200),
+            ("/admin/", 200),
+            ("/admin//Todo", 200),
+            ("/admin/Todo/", 200),
+            (f"/admin/Todo//{row_id}/", 200),
+            ("/admin/Todo/abc", 400),
+            ("/admin/Todo/999", 404),
+            ("/admin/Nope", 404),
+        ]
+        for path, expected in cases:
+            status, _, body = self.request("GET", path)
+            self.assertEqual(status, expected, path)
+        _, _, body = self.request("GET", f"/admin/Todo/{row_id}")
+        self.assertIn(b"routed", body)
+        status, _, _ = self.request("POST", f"/admin/Todo/{row_id}/update/extra", {"csrf_token": token})
+        self.assertEqual(status, 404)
+        status, _, _ = self.request("POST", "/admin/", {"csrf_token": token})
+        self.assertEqual(status, 404)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,149 @@
+import json
+import os
+import tempfile
+import unittest
+from pathlib import Path
+
+from vibeweb import spec as spec_module
+from vibeweb.spec import clear_spec_cache, load_app_spec, validate_spec
+
+
+def _spec(models):
+    return {"db": {"models": models}}
+
+
+class TestSpecModels(unittest.TestCase):
+    def test_forward_ref(self) -> None:
+        app = validate_spec(
+            _spec(
+                [
+                    {"name": "Contact", "fields": {"account": "ref:Account", "name": "text"}},
+                    {"name": "Account", "fields": {"name": "text"}},
+                ]
+            )
+        )
+        self.assertEqual([m.name for m in app.models], ["Contact", "Account"])
+        self.assertEqual(app.models[0].fields["account"], "ref:Account")
+
+    def test_unknown_ref_target(self) -> None:
+        with self.assertRaisesRegex(ValueError, r"ref target 'Nope' not found for Contact\.account"):
+            validate_spec(_spec([{"name": "Contact", "fields": {"account": "ref:Nope"}}]))
+
+    def test_duplicate_model(self) -> None:
+        with self.assertRaisesRegex(ValueError, "duplicate model name: A"):
+            validate_spec(_spec([{"name": "A", "fields": {"x": "text"}}, {"name": "A", "fields": {"x": "text"}}]))
+
+    def test_invalid_field_type(self) -> None:
+        with self.assertRaisesRegex(ValueError, "invalid field type 'ref:' in A"):
+            validate_spec(_spec([{"name": "A", "fields": {"x": "ref:"}}]))
+        with self.assertRaisesRegex(ValueError, "invalid field type 'blob' in A"):
+            validate_spec(_spec([{"name": "A", "fields": {"x": "blob"}}]))
+
+    def test_str_subclass_names(self) -> None:
+        class Name(str):
+            pass
+
+        app = validate_spec(
+            {
+                "db": {"models": [{"name": Name("A"), "fields": {Name("x"): Name("text")}}]},
+                "api": {
+                    "actions": [
+                        {
+                            "name": Name("ping"),
+                            "kind": Name("http"),
+                            "http": {"url": "https://example.com", "headers": {Name("X-Key"): "v"}},
+                        }
+                    ]
+                },
+            }
+        )
+        self.assertIs(type(app.models[0].name), str)
+        self.assertEqual(app.models[0].fields, {"x": "text"})
+        self.assertEqual(app.actions[0].http.headers, {"X-Key": "v"})
+
+    def test_identifier_rules(self) -> None:
+        for name in ("1a", "a-b", "é", "a\n", "a b"):
+            with self.assertRaisesRegex(ValueError, "model.name must match"):
+                validate_spec(_spec([{"name": name, "fields": {"x": "text"}}]))
+        app = validate_spec(_spec([{"name": "_Ok1", "fields": {"x_2": "text"}}]))
+        self.assertEqual(app.models[0].name, "_Ok1")
+
+
+class TestSpecConditions(unittest.TestCase):
+    def test_errors_in_document_order(self) -> None:
+        cond = {"$and": [{"$eq": ["row.a", 1]}, {"$bogus": 1}, {"$in": "x"}]}
+        with self.assertRaisesRegex(ValueError, r"unknown operator: '\$bogus'"):
+            spec_module._validate_condition(cond, what="hook.when")
+
+    def test_depth_and_size_limits(self) -> None:
+        cond: object = {"row.a": 1}
+        for _ in range(spec_module._COND_MAX_DEPTH):
+            cond = {"$not": cond}
+        spec_module._validate_condition(cond, what="hook.when")
+        with self.assertRaisesRegex(ValueError, "nested too deeply"):
+            spec_module._validate_condition({"$not": cond}, what="hook.when")
+        with self.assertRaisesRegex(ValueError, "too large"):
+            spec_module._validate_condition([{"row.a": 1}] * spec_module._COND_MAX_NODES, what="hook.when")
+
+    def test_any_all_operand_is_validated(self) -> None:
+        for op in ("$any", "$all"):
+            with self.assertRaisesRegex(ValueError, r"unknown operator: '\$bogus'"):
+                spec_module._validate_condition({op: ["row.items", {"$bogus": 1}]}, what="hook.when")
+            cond: object = {"item.ok": True}
+            for _ in range(5000):
+                cond = {op: ["item.items", cond]}
+            with self.assertRaisesRegex(ValueError, "nested too deeply"):
+                spec_module._validate_condition(cond, what="hook.when")
+            spec_module._validate_condition({op: ["row.items", {"$eq": ["item.ok", True]}]}, what="hook.when")
+
+
+class TestSpecCache(unittest.TestCase):
+    def setUp(self) -> None:
+        clear_spec_cache()
+        self.addCleanup(clear_spec_cache)
+        self.path = Path(tempfile.mkdtemp()) / "app.vweb.json"
+
+    def _write(self, models, mtime_ns: int) -> None:
+        self.path.write_text(json.dumps(_spec(models)), encoding="utf-8")
+        os.utime(self.path, ns=(mtime_ns, mtime_ns))
+
+    def test_reuses_app_until_file_changes(self) -> None:
+        self._write([{"name": "A", "fields": {"x": "text"}}], 1_000_000_000)
+        first = load_app_spec(str(self.path))
+        again = load_app_spec(str(self.path))
+        self.assertEqual(again, first)
+        self.assertIsNot(again, first)
+        self._write([{"name": "B", "fields": {"x": "int"}}], 2_000_000_000)
+        second = load_app_spec(str(self.path))
+        self.assertEqual([m.name for m in second.models], ["B"])
+
+    def test_callers_get_independent_copies(self) -> None:
+        self._write([{"name": "A", "fields": {"x": "text"}}], 1_000_000_000)
+        first = load_app_spec(str(self.path))
+        first.models[0].fields["y"] = "int"
+        first.models.append(first.models[0])
+        second = load_app_spec(str(self.path))
+        self.assertEqual(len(second.models), 1)
+        self.assertEqual(second.models[0].fields, {"x": "text"})
+
+    def test_size_change_with_same_mtime_reloads(self) -> None:
+        self._write([{"name": "A", "fields": {"x": "text"}}], 1_000_000_000)
+        load_app_spec(str(self.path))
+        self._write([{"name": "Longer", "fields": {"x": "text"}}], 1_000_000_000)
+        self.assertEqual([m.name for m in load_app_spec(str(self.path)).models], ["Longer"])
+
+    def test_invalid_spec_is_not_cached(self) -> None:
+        self._write([{"name": "A", "fields": {"x": "blob"}}], 1_000_000_000)
+        for _ in range(2):
+            with self.assertRaises(ValueError):
+                load_app_spec(str(self.path))
+
+    def test_cache_is_bounded(self) -> None:
+        for i in range(spec_module._SPEC_CACHE_SIZE + 5):
+            self._write([{"name": f"M{i}", "fields": {"x": "text"}}], 1_000_000_000 + i)
+            load_app_spec(str(self.path))
+        self.assertEqual(len(spec_module._SPEC_CACHE), spec_module._SPEC_CACHE_SIZE)
+
+
+if __name__ == "__main__":
+    unittest.main()
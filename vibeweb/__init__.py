@@ -1,4 +1,4 @@
-from vibeweb.spec import AppSpec, ModelSpec, PageSpec, load_spec, validate_spec
+from vibeweb.spec import AppSpec, ModelSpec, PageSpec, load_app_spec, load_spec, validate_spec
 from vibeweb.server import run_server
 from vibeweb.version import get_version
 
@@ -8,6 +8,7 @@ __all__ = [
     "AppSpec",
     "ModelSpec",
     "PageSpec",
+    "load_app_spec",
     "load_spec",
     "validate_spec",
     "run_server",
@@ -12,6 +12,7 @@ from dataclasses import asdict
 from typing import Any
 from urllib.parse import urlparse
 
+from vibeweb import jsonio
 from vibeweb.conditions import ConditionError, eval_condition, lookup_path
 from vibeweb.db import delete_row, get_row, insert_row, list_rows, normalize_row, update_row
 from vibeweb.spec import (
@@ -189,7 +190,7 @@ def _json_request(
     payload: dict[str, Any],
     headers: dict[str, str] | None,
 ) -> urllib.request.Request:
-    data = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+    data = jsonio.dumps(payload)
     req = urllib.request.Request(url, data=data, method="POST")
     req.add_header("Content-Type", "application/json")
     req.add_header("Accept", "application/json")
@@ -214,7 +215,7 @@ def _execute_http(action: HttpActionSpec, ctx: dict[str, Any], method_fallback:
     data = None
     if method not in ("GET", "HEAD"):
         body_rendered = render_value(body_value, ctx)
-        data = json.dumps(body_rendered, ensure_ascii=False).encode("utf-8")
+        data = jsonio.dumps(body_rendered)
         headers.setdefault("Content-Type", "application/json")
     headers.setdefault("Accept", "application/json")
 
@@ -8,7 +8,7 @@ from typing import Any, Dict
 from vibeweb.server import run_server
 from vibeweb.gallery import run_gallery
 from vibeweb.ai import generate_spec
-from vibeweb.spec import load_spec, validate_spec
+from vibeweb.spec import load_app_spec
 from vibeweb.version import get_version
 
 
@@ -85,8 +85,7 @@ def cmd_validate(args: argparse.Namespace) -> int:
     errors: list[tuple[Path, Exception]] = []
     for f in unique:
         try:
-            spec = load_spec(str(f))
-            validate_spec(spec)
+            load_app_spec(str(f))
         except Exception as exc:  # noqa: BLE001
             errors.append((f, exc))
 
@@ -103,8 +102,7 @@ def cmd_validate(args: argparse.Namespace) -> int:
 
 
 def cmd_run(args: argparse.Namespace) -> int:
-    spec = load_spec(args.file)
-    app = validate_spec(spec)
+    app = load_app_spec(args.file)
     run_server(app, host=args.host, port=args.port)
     return 0
 
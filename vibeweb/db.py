@@ -1,8 +1,11 @@
 import json
-import re
+import os
 import sqlite3
 from typing import Any, Dict, Iterable, List, Tuple
 
+from urllib.parse import quote
+
+from vibeweb import jsonio
 from vibeweb.spec import ModelSpec
 
 
@@ -15,12 +18,11 @@ _SQL_TYPES = {
     "json": "TEXT",
 }
 
-_SAFE_IDENT_RE = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*$")
-
 
 def _require_safe_ident(value: str, *, what: str) -> None:
     # Keep SQLite identifiers simple and safe, since we build SQL strings.
-    if not _SAFE_IDENT_RE.match(value):
+    # ASCII identifiers are exactly ^[A-Za-z_][A-Za-z0-9_]*$ (and a trailing newline is rejected).
+    if not (value.isidentifier() and value.isascii()):
         raise ValueError(f"Invalid {what} identifier: {value!r}")
 
 
@@ -30,9 +32,31 @@ def _sql_type(field_type: str) -> str:
     return _SQL_TYPES[field_type]
 
 
-def connect(path: str, *, check_same_thread: bool = True) -> sqlite3.Connection:
-    conn = sqlite3.connect(path, check_same_thread=check_same_thread)
+def _is_memory_path(path: str) -> bool:
+    return not path or path == ":memory:" or path.startswith("file::memory:") or "mode=memory" in path
+
+
+def connect(path: str, *, check_same_thread: bool = True, read_only: bool = False) -> sqlite3.Connection:
+    memory = _is_memory_path(path)
+    if read_only and not memory:
+        uri = "file:" + quote(os.path.abspath(path)) + "?mode=ro"
+        conn = sqlite3.connect(uri, uri=True, check_same_thread=check_same_thread)
+    else:
+        conn = sqlite3.connect(path, check_same_thread=check_same_thread)
     conn.row_factory = sqlite3.Row
+    if not memory:
+        # WAL lets readers keep going while another connection commits; NORMAL is durable enough under WAL.
+        try:
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("PRAGMA temp_store=MEMORY")
+            if not read_only:
+                conn.execute("PRAGMA journal_mode=WAL")
+                # Large page cache and mmap for the writer only; pooled readers keep SQLite's defaults
+                # so each extra connection does not add another ~20 MB cache and 256 MB mapping.
+                conn.execute("PRAGMA mmap_size=268435456")
+                conn.execute("PRAGMA cache_size=-20000")
+        except sqlite3.DatabaseError:
+            pass
     return conn
 
 
@@ -71,29 +95,29 @@ def normalize_row(model: ModelSpec, row: Dict[str, Any]) -> Dict[str, Any]:
     - everything else is passed through
     """
     normalized: Dict[str, Any] = {"id": row.get("id")}
-    for field, ftype in model.fields.items():
-        value = row.get(field)
-        if ftype == "bool":
-            if value is None:
-                normalized[field] = None
-            else:
-                try:
-                    normalized[field] = bool(int(value))
-                except Exception:
-                    normalized[field] = bool(value)
-        elif ftype == "json":
-            if isinstance(value, str):
-                try:
-                    normalized[field] = json.loads(value)
-                except Exception:
-                    normalized[field] = value
-            else:
-                normalized[field] = value
-        else:
-            normalized[field] = value
+    for field, ftype in model.field_items:
+        normalized[field] = _normalize_value(ftype, row.get(field))
     return normalized
 
 
+def _normalize_value(ftype: str, value: Any) -> Any:
+    if ftype == "bool":
+        if value is None:
+            return None
+        try:
+            return bool(int(value))
+        except Exception:
+            return bool(value)
+    if ftype == "json":
+        if isinstance(value, str):
+            try:
+                return jsonio.loads(value)
+            except Exception:
+                return value
+        return value
+    return value
+
+
 def normalize_rows(model: ModelSpec, rows: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
     return [normalize_row(model, row) for row in rows]
 
@@ -116,6 +140,46 @@ def list_rows(
     return [dict(row) for row in cursor.fetchall()]
 
 
+def list_rows_normalized(
+    conn: sqlite3.Connection,
+    model: ModelSpec,
+    *,
+    limit: int = 100,
+    offset: int = 0,
+    where: str = "",
+    params: tuple[Any, ...] = (),
+    order_by: str = "id DESC",
+) -> List[Dict[str, Any]]:
+    """
+    Same query as `list_rows`, but returns `normalize_row`-shaped dicts directly.
+
+    Rows are fetched as plain tuples and read by column position (resolved once per query),
+    so each row is built once instead of going sqlite3.Row -> dict -> normalized dict.
+    """
+    sql = f"SELECT * FROM {model.name}"
+    if where:
+        sql += " WHERE " + where
+    sql += f" ORDER BY {order_by} LIMIT ? OFFSET ?"
+    cursor = conn.cursor()
+    cursor.row_factory = None
+    cursor.execute(sql, params + (limit, offset))
+    index = {col[0]: i for i, col in enumerate(cursor.description)}
+    id_idx = index.get("id")
+    # (field, type needing conversion or None, column index); keeps model field order for the output dict.
+    plan = [
+        (field, ftype if ftype in ("bool", "json") else None, index.get(field))
+        for field, ftype in model.field_items
+    ]
+    out: List[Dict[str, Any]] = []
+    for row in cursor.fetchall():
+        normalized: Dict[str, Any] = {"id": row[id_idx] if id_idx is not None else None}
+        for field, convert, idx in plan:
+            value = row[idx] if idx is not None else None
+            normalized[field] = value if convert is None else _normalize_value(convert, value)
+        out.append(normalized)
+    return out
+
+
 def count_rows(
     conn: sqlite3.Connection,
     model: ModelSpec,
@@ -131,6 +195,18 @@ def count_rows(
     return int(row["count"]) if row else 0
 
 
+def count_rows_many(conn: sqlite3.Connection, models: Iterable[ModelSpec]) -> Dict[str, int]:
+    # One UNION ALL statement instead of a COUNT(*) round trip per table.
+    parts = []
+    for model in models:
+        _require_safe_ident(model.name, what="table")
+        parts.append(f"SELECT '{model.name}' AS name, COUNT(*) AS count FROM \"{model.name}\"")
+    if not parts:
+        return {}
+    cursor = conn.execute(" UNION ALL ".join(parts))
+    return {str(row[0]): int(row[1]) for row in cursor.fetchall()}
+
+
 def get_row(conn: sqlite3.Connection, model: ModelSpec, row_id: int) -> Dict[str, Any] | None:
     cursor = conn.execute(f"SELECT * FROM {model.name} WHERE id = ?", (row_id,))
     row = cursor.fetchone()
@@ -140,10 +216,10 @@ def get_row(conn: sqlite3.Connection, model: ModelSpec, row_id: int) -> Dict[str
 def insert_row(conn: sqlite3.Connection, model: ModelSpec, data: Dict[str, Any]) -> Dict[str, Any]:
     fields: List[str] = []
     values: List[Any] = []
-    for name in model.fields.keys():
+    for name, ftype in model.field_items:
         if name in data:
             fields.append(name)
-            values.append(_coerce_value(model.fields[name], data[name]))
+            values.append(_coerce_value(ftype, data[name]))
     if not fields:
         raise ValueError("No fields provided")
     placeholders = ", ".join(["?"] * len(fields))
@@ -156,10 +232,10 @@ def insert_row(conn: sqlite3.Connection, model: ModelSpec, data: Dict[str, Any])
 def update_row(conn: sqlite3.Connection, model: ModelSpec, row_id: int, data: Dict[str, Any]) -> Dict[str, Any] | None:
     fields: List[str] = []
     values: List[Any] = []
-    for name in model.fields.keys():
+    for name, ftype in model.field_items:
         if name in data:
             fields.append(f"{name} = ?")
-            values.append(_coerce_value(model.fields[name], data[name]))
+            values.append(_coerce_value(ftype, data[name]))
     if not fields:
         return get_row(conn, model, row_id)
     values.append(row_id)
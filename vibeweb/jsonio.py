@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+import json
+import math
+from typing import Any
+
+try:
+    import orjson  # Optional: several times faster than the stdlib encoder/decoder.
+except Exception:  # pragma: no cover
+    orjson = None  # type: ignore[assignment]
+
+# orjson parses integers beyond 64 bits as floats; leave payloads with 19+ digit runs to the
+# stdlib parser. Detected by folding every digit to "0" and searching for the run: an
+# re.search(r"\d{19}") scan costs several times more than the orjson parse it guards.
+_LONG_DIGITS = b"0" * 19
+_LONG_DIGITS_TEXT = "0" * 19
+_DIGITS_TO_ZERO = bytes(48 if 48 <= i <= 57 else 32 for i in range(256))
+_DIGITS_TO_ZERO_TEXT = str.maketrans("123456789", "000000000")
+
+
+def _has_long_digits(raw: bytes | str) -> bool:
+    if type(raw) is str:
+        return _LONG_DIGITS_TEXT in raw.translate(_DIGITS_TO_ZERO_TEXT)
+    return _LONG_DIGITS in raw.translate(_DIGITS_TO_ZERO)
+
+
+def _finite(data: Any) -> Any:
+    """Copy of data with NaN/Infinity floats replaced by None, as orjson encodes them."""
+    if isinstance(data, float):
+        return data if math.isfinite(data) else None
+    if isinstance(data, dict):
+        return {k: _finite(v) for k, v in data.items()}
+    if isinstance(data, (list, tuple)):
+        return [_finite(v) for v in data]
+    return data
+
+
+def dumps(data: Any) -> bytes:
+    """Compact UTF-8 JSON bytes (non-ASCII left unescaped), as the API sends them.
+
+    Always valid JSON: NaN and Infinity become null with either backend.
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(data)
+        except TypeError:
+            # Non-str keys, >64-bit ints, lone surrogates: the stdlib handles these.
+            pass
+    try:
+        text = json.dumps(data, ensure_ascii=False, separators=(",", ":"), allow_nan=False)
+    except ValueError as exc:
+        if "Out of range float" not in str(exc):
+            raise
+        text = json.dumps(_finite(data), ensure_ascii=False, separators=(",", ":"), allow_nan=False)
+    return text.encode("utf-8")
+
+
+def loads(raw: bytes | str) -> Any:
+    """Parse UTF-8 JSON bytes (or an already-decoded str); raises ValueError on invalid input."""
+    if orjson is not None and not _has_long_digits(raw):
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            # Stay as lenient as json.loads (NaN/Infinity literals); genuine errors re-raise below.
+            pass
+    return json.loads(raw if type(raw) is str else raw.decode("utf-8"))
@@ -1,37 +1,88 @@
 from __future__ import annotations
 
 import base64
+import contextlib
+import functools
+import gzip
+import hashlib
 import html
 import hmac
 import json
 import math
 import os
+import queue
+import re
 import secrets
+import socket
+import sqlite3
+import string
 import threading
 import time
+from collections import OrderedDict
+from dataclasses import dataclass
 from http import HTTPStatus
-from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from http.server import BaseHTTPRequestHandler, HTTPServer
 from pathlib import Path
-from urllib.parse import parse_qs, urlparse, urlencode
-from typing import Any, Dict, Optional
+from urllib.parse import ParseResult, parse_qsl, urlparse, urlencode
+from typing import Any, Callable, Dict, Iterator, Optional
 
+from vibeweb import jsonio
 from vibeweb.actions import ActionError, action_debug_dict, execute_action
 from vibeweb.conditions import ConditionError, eval_condition
 from vibeweb.db import (
+    _is_memory_path,
     connect,
     count_rows,
+    count_rows_many,
     delete_row,
     ensure_schema,
     get_row,
     insert_row,
     list_rows,
+    list_rows_normalized,
     normalize_row as db_normalize_row,
-    normalize_rows as db_normalize_rows,
     update_row,
 )
-from vibeweb.spec import AppSpec, ModelSpec, _is_ref_type, _ref_target, ActionSpec, HookSpec
+from vibeweb.spec import AppSpec, ModelSpec, PageSpec, _is_ref_type, _ref_target_or_none, ActionSpec, HookSpec
 
 STATIC_DIR = Path(__file__).with_name("static")
+_STATIC_ROOT = STATIC_DIR.resolve()
+
+_STATIC_TYPES = {
+    ".css": "text/css; charset=utf-8",
+    ".js": "text/javascript; charset=utf-8",
+    ".png": "image/png",
+    ".svg": "image/svg+xml",
+    ".woff2": "font/woff2",
+}
+# Resolved path -> (st_mtime_ns, body, content type, quoted ETag).
+_STATIC_CACHE: dict[Path, tuple[int, bytes, str, str]] = {}
+_STATIC_CACHE_LOCK = threading.Lock()
+
+def _query_params(query: str) -> dict[str, str]:
+    """Single-valued query params (first occurrence wins, blank values dropped), like parse_qs()[k][0]."""
+    params: dict[str, str] = {}
+    for key, value in parse_qsl(query):
+        params.setdefault(key, value)
+    return params
+
+
+@dataclass(frozen=True, slots=True)
+class QueryOpts:
+    """List options parsed once from a query string; _query_rows clamps limit/offset and checks sort."""
+
+    params: dict[str, str]
+    q: str
+    sort: str
+    direction: str
+    limit: int
+    offset: int
+    page: int
+    filters: dict[str, str]
+
+
+# /api/<model>[/<id>]; anything past the id segment is ignored.
+_API_PATH_RE = re.compile(r"/api/([^/]*)(?:/([^/]*))?")
 
 _TAILWIND_FONTS = (
     "<link rel=\"preconnect\" href=\"https://fonts.googleapis.com\">"
@@ -146,6 +197,296 @@ THEME = {
 }
 
 
+# Page templates are compiled once per app: theme classes (`{t[...]}`) and the escaped admin path
+# (`{admin}`) are substituted up front, leaving only the per-request holes (`{{...}}`) for str.format.
+_PAGE_TEMPLATES: dict[str, str] = {
+    "page_open": (
+        "<div class=\"{t[stack]}\">"
+        "<header class=\"{t[header]}\">"
+        "<div><h1 class=\"{t[header_title]}\">{{safe_title}}</h1>"
+        "<p class=\"{t[header_subtitle]}\">Auto-generated from {{safe_model}}</p></div>"
+        "<span class=\"{t[header_tag]}\">{{safe_model}}</span>"
+        "</header>"
+        "<div class=\"{t[panel]}\">"
+        "<h2 class=\"{t[panel_title]}\">Create</h2>"
+        "<form method=\"post\" action=\"/api/{{safe_model}}\" "
+        "enctype=\"application/x-www-form-urlencoded\">"
+        "<div class=\"{t[form_grid]}\">"
+    ),
+    "page_table_open": (
+        "</div><div class=\"mt-4 flex justify-end\">"
+        "<button class=\"{t[btn_primary]}\" "
+        "type=\"submit\">Create</button></div></form></div>"
+        "<div class=\"{t[panel]}\">"
+        "<h2 class=\"{t[panel_title]}\">Entries</h2>"
+        "<div class=\"{t[table_wrap]}\">"
+        "<table class=\"{t[table]}\">"
+        "<thead class=\"{t[thead]}\"><tr>"
+    ),
+    "tbody_open": "</tr></thead><tbody class=\"{t[tbody]}\">",
+    "page_close": "</tbody></table></div></div></div>",
+    "home_open": (
+        "<header class=\"{t[header]}\">"
+        "<div><h1 class=\"{t[header_title]}\">Admin</h1>"
+        "<p class=\"{t[header_subtitle]}\">System overview</p></div>"
+        "<span class=\"{t[header_tag]}\">Dashboard</span></header>"
+        "<div class=\"{t[grid]}\">"
+    ),
+    "home_card": (
+        "<div class=\"{t[card]}\"><h3 class=\"{t[card_title]}\">{{safe_model}}</h3>"
+        "<p class=\"mt-2\"><span class=\"{t[badge]}\">{{count}} rows</span></p>"
+        "<p class=\"mt-4 flex gap-3 text-sm font-semibold\">"
+        "<a class=\"{t[link]}\" href=\"{admin}/{{safe_model}}\">Manage</a>"
+        "<a class=\"{t[link_muted]}\" href=\"/api/{{safe_model}}\">API</a></p></div>"
+    ),
+    "admin_model_open": (
+        "<div class=\"{t[stack]}\">"
+        "<header class=\"{t[header]}\">"
+        "<div><h1 class=\"{t[header_title]}\">{{safe_model}}</h1>"
+        "<p class=\"text-xs uppercase tracking-[0.3em] text-slate-500\">/{{safe_model}}</p></div>"
+        "<span class=\"{t[header_tag]}\">{{row_count}} rows</span></header>"
+        "<div class=\"{t[panel]}\">"
+        "<h2 class=\"{t[panel_title]}\">Create</h2>"
+        "<form method=\"post\" action=\"{admin}/{{safe_model}}/create\" "
+        "enctype=\"application/x-www-form-urlencoded\">"
+        "{{csrf_field}}"
+        "<div class=\"{t[form_grid]}\">"
+    ),
+    "admin_model_search": (
+        "</div><div class=\"mt-4 flex justify-end\">"
+        "<button class=\"{t[btn_primary]}\" "
+        "type=\"submit\">Create</button></div></form></div>"
+        "<div class=\"{t[panel]}\">"
+        "<h2 class=\"{t[panel_title]}\">Filter</h2>"
+        "<form method=\"get\" action=\"\">"
+        "<div class=\"mt-4 flex flex-wrap items-end gap-4\">"
+        "<label class=\"{t[label]}\">"
+        "Query<input class=\"{t[input]}\" "
+        "name=\"q\" value=\"{{safe_q}}\" placeholder=\"Search\"/></label>"
+    ),
+    "admin_model_filters": (
+        "<button class=\"{t[btn_dark]}\" "
+        "type=\"submit\">Apply</button>"
+        "</div>"
+        "<div class=\"mt-4 grid gap-4 md:grid-cols-2 lg:grid-cols-3\">"
+    ),
+    "admin_model_table": (
+        "</div>"
+        "<input type=\"hidden\" name=\"limit\" value=\"{{limit}}\"/>"
+        "</form></div>"
+        "<div class=\"{t[panel]}\">"
+        "<h2 class=\"{t[panel_title]}\">Rows</h2>"
+        "<div class=\"{t[table_wrap]}\">"
+        "<table class=\"{t[table]}\"><thead "
+        "class=\"{t[thead]}\"><tr>"
+    ),
+    "admin_model_tbody": "<th class=\"{t[cell]} text-left\">Actions</th></tr></thead><tbody class=\"{t[tbody]}\">",
+    "admin_row_edit": "<td class=\"{t[cell]}\"><a class=\"{t[link]}\" href=\"{admin}/{{safe_model}}/",
+    "admin_row_delete": "\">Edit</a> <form method=\"post\" action=\"{admin}/{{safe_model}}/",
+    "admin_row_close": (
+        "/delete\" style=\"display:inline\">"
+        "{{csrf_field}}"
+        "<button class=\"{t[btn_outline]}\" type=\"submit\">Delete</button></form></td></tr>"
+    ),
+    "admin_model_pagination": (
+        "</tbody></table></div></div>"
+        "<div class=\"mt-4 flex items-center justify-between text-xs text-slate-600\">"
+        "<span>Page {{page}} of {{total_pages}} · {{total}} total</span>"
+        "<div class=\"flex gap-2\">"
+        "<a class=\"{t[btn_outline]} {{prev_disabled}}\" href=\"{{base_qs}}{{prev_page}}\">Prev</a>"
+        "<a class=\"{t[btn_outline]} {{next_disabled}}\" href=\"{{base_qs}}{{next_page}}\">Next</a>"
+        "</div></div></div>"
+    ),
+    "edit_open": (
+        "<div class=\"{t[stack]}\">"
+        "<header class=\"{t[header]}\">"
+        "<div><h1 class=\"{t[header_title]}\">{{safe_model}} #{{safe_id}}</h1>"
+        "<p class=\"{t[header_subtitle]}\">Edit entry</p></div>"
+        "<span class=\"{t[header_tag]}\">Edit</span></header>"
+        "<div class=\"{t[panel]}\">"
+        "<h2 class=\"{t[panel_title]}\">Update</h2>"
+        "<form method=\"post\" action=\"{admin}/{{safe_model}}/{{safe_id}}/update\" "
+        "enctype=\"application/x-www-form-urlencoded\">"
+        "{{csrf_field}}"
+        "<div class=\"{t[form_grid]}\">"
+    ),
+    "edit_close": (
+        "</div><div class=\"mt-4 flex justify-end\">"
+        "<button class=\"{t[btn_dark]}\" "
+        "type=\"submit\">Update</button></div></form></div></div>"
+    ),
+    "input_ref": (
+        "<label class=\"{t[label]}\">{{safe_name}}"
+        "<select class=\"{t[input]}\" name=\"{{safe_name}}\">"
+        "<option value=\"\">--</option>{{options}}</select></label>"
+    ),
+    "input_bool": (
+        "<label class=\"{t[label]}\">"
+        "{{safe_name}}<select class=\"{t[input]}\" name=\"{{safe_name}}\">{{options}}</select></label>"
+    ),
+    "input_json": (
+        "<label class=\"{t[label]}\">{{safe_name}}"
+        "<textarea class=\"{t[input]}\" name=\"{{safe_name}}\" rows=\"4\">{{safe_value}}</textarea></label>"
+    ),
+    "input_plain": (
+        "<label class=\"{t[label]}\">{{safe_name}}"
+        "<input class=\"{t[input]}\" name=\"{{safe_name}}\" type=\"{{input_type}}\" {{value_attr}}/></label>"
+    ),
+}
+
+
+def _brace_escape(value: str) -> str:
+    return value.replace("{", "{{").replace("}", "}}")
+
+
+def _compile_templates(theme: dict[str, str], safe_admin_path: str) -> dict[str, str]:
+    braced = {k: _brace_escape(v) for k, v in theme.items()}
+    admin = _brace_escape(safe_admin_path)
+    compiled: dict[str, str] = {}
+    for name, source in _PAGE_TEMPLATES.items():
+        text = source.format(t=braced, admin=admin)
+        # Templates without request-time holes are stored as finished strings.
+        if all(field is None for _, field, _, _ in string.Formatter().parse(text)):
+            text = text.format()
+        compiled[name] = text
+    return compiled
+
+
+class _ModelFragments:
+    """Escaped model strings plus memoized table headers and create forms (one entry per field list)."""
+
+    def __init__(self, model: ModelSpec, theme: dict[str, str], tpl: dict[str, str]) -> None:
+        self.model = model
+        self.theme = theme
+        self.tpl = tpl
+        self.safe_name = _esc(model.name)
+        self._th_open = f"<th class=\"{theme['cell']} text-left\">"
+        self.filter_inputs = {
+            field: _filter_input_renderer(field, ftype, theme=theme) for field, ftype in model.fields.items()
+        }
+        self.sort_select = _sort_select_renderer(model, theme=theme)
+        # bool field -> (unchecked, checked) edit inputs; a bool input has no other render state.
+        self.bool_inputs = {
+            field: (_input_for(field, "bool", tpl=tpl, value="0"), _input_for(field, "bool", tpl=tpl, value="1"))
+            for field, ftype in model.field_items
+            if ftype == "bool"
+        }
+        self._header_rows: dict[tuple[str, ...], str] = {}
+        self._create_forms: dict[tuple[str, ...], list[tuple[str, str | None]]] = {}
+
+    def header_row(self, fields: list[str]) -> str:
+        key = tuple(fields)
+        cached = self._header_rows.get(key)
+        if cached is None:
+            th_open = self._th_open
+            cached = "".join([f"{th_open}{_esc_text(f)}</th>" for f in ("id",) + key])
+            self._header_rows[key] = cached
+        return cached
+
+    def create_inputs(self, fields: list[str], ref_choices: dict[str, list[tuple[Any, str]]]) -> str:
+        """Empty inputs for `fields`; only ref-field options (which follow the data) are rendered per call."""
+        key = tuple(fields)
+        plan = self._create_forms.get(key)
+        if plan is None:
+            # [(constant markup, ref field whose <option>s follow it or None)], adjacent constants merged.
+            plan = []
+            pending: list[str] = []
+            for field in key:
+                ftype = self.model.fields[field]
+                if _is_ref_type(ftype):
+                    # Split the compiled ref template around its options hole; theme classes are already baked in.
+                    head, tail = self.tpl["input_ref"].format(safe_name=_esc(field), options="\0").split("\0")
+                    pending.append(head)
+                    plan.append(("".join(pending), field))
+                    pending = [tail]
+                else:
+                    pending.append(_input_for(field, ftype, tpl=self.tpl))
+            plan.append(("".join(pending), None))
+            self._create_forms[key] = plan
+        if len(plan) == 1:
+            return plan[0][0]
+        out: list[str] = []
+        for markup, ref_field in plan:
+            out.append(markup)
+            if ref_field is not None:
+                out.append(_select_options(ref_choices.get(ref_field), ""))
+        return "".join(out)
+
+
+class _AppFragments:
+    """Render inputs derived from an AppSpec that never change while the server runs."""
+
+    def __init__(self, app: AppSpec) -> None:
+        self.app = app
+        self.theme = _theme(app)
+        self.safe_name = _esc(app.name)
+        self.safe_admin_path = _esc(app.admin_path)
+        self.tpl = _compile_templates(self.theme, self.safe_admin_path)
+        # Table-body markup, with neighbouring constants fused so each cell costs two appends.
+        cell_open = f"<td class=\"{self.theme['cell']}\">"
+        self.row_open = f"<tr class=\"{self.theme['row']}\">" + cell_open
+        self.cell_next = "</td>" + cell_open
+        # Shell chrome around the per-request title and nav links; the Tailwind head is the bulk of it.
+        theme = self.theme
+        self.shell_head = "<!doctype html><html><head><meta charset=\"utf-8\"/><title>"
+        self.shell_after_title = (
+            "</title>"
+            f"{_tailwind_head(app)}"
+            "</head>"
+            f"<body class=\"{theme['body']}\">"
+            f"<div class=\"{theme['grid_overlay']}\"></div>"
+            f"<div class=\"{theme['shell']}\">"
+            f"<div class=\"{theme['container']}\">"
+            f"<div class=\"{theme['topbar']}\">"
+            f"<div class=\"{theme['brand']}\">{self.safe_name}</div>"
+            f"<nav class=\"{theme['nav']}\">"
+        )
+        self.shell_after_nav = f"</nav></div><main class=\"{theme['surface']}\">"
+        self.shell_close = "</main></div></div></body></html>"
+        self._nav: dict[tuple[tuple[str, str], ...], str] = {}
+        self._models: dict[str, _ModelFragments] = {}
+
+    def nav(self, links: list[tuple[str, str]]) -> str:
+        key = tuple(links)
+        cached = self._nav.get(key)
+        if cached is None:
+            link_cls = self.theme["nav_link"]
+            cached = "".join([f"<a class=\"{link_cls}\" href=\"{_esc(href)}\">{_esc(label)}</a>" for label, href in links])
+            self._nav[key] = cached
+        return cached
+
+    def model(self, model: ModelSpec) -> _ModelFragments:
+        cached = self._models.get(model.name)
+        if cached is None or cached.model is not model:
+            cached = _ModelFragments(model, self.theme, self.tpl)
+            self._models[model.name] = cached
+        return cached
+
+
+# id(app) -> fragments, least recently used first. Bounded so reloaded or gallery specs are
+# released; each entry holds its AppSpec, so an id cannot be reused while it is cached.
+_FRAGMENTS: OrderedDict[int, _AppFragments] = OrderedDict()
+_FRAGMENTS_SIZE = 8
+_FRAGMENTS_LOCK = threading.Lock()
+
+
+def _fragments(app: AppSpec) -> _AppFragments:
+    # Keyed by identity: specs are plain (unhashable) dataclasses and are not mutated once served.
+    key = id(app)
+    with _FRAGMENTS_LOCK:
+        cached = _FRAGMENTS.get(key)
+        if cached is not None and cached.app is app:
+            _FRAGMENTS.move_to_end(key)
+            return cached
+    cached = _AppFragments(app)
+    with _FRAGMENTS_LOCK:
+        _FRAGMENTS[key] = cached
+        _FRAGMENTS.move_to_end(key)
+        while len(_FRAGMENTS) > _FRAGMENTS_SIZE:
+            _FRAGMENTS.popitem(last=False)
+    return cached
+
+
 class RateLimiter:
     def __init__(self, limit_per_minute: int) -> None:
         self.limit = max(1, limit_per_minute)
@@ -165,7 +506,22 @@ class RateLimiter:
 def _esc(value: Any) -> str:
     if value is None:
         return ""
-    return html.escape(str(value), quote=True)
+    text = value if type(value) is str else str(value)
+    # Most values contain nothing to escape. Substring tests are memchr scans, so even long
+    # values are cleared far faster than by a regex (or str.translate) pass.
+    if "&" in text or "<" in text or ">" in text or '"' in text or "'" in text:
+        return html.escape(text, quote=True)
+    return text
+
+
+def _esc_text(value: Any) -> str:
+    """Escape for element content only (table cells); quotes are left alone, so never use it in attributes."""
+    if value is None:
+        return ""
+    text = value if type(value) is str else str(value)
+    if "&" in text or "<" in text or ">" in text:
+        return html.escape(text, quote=False)
+    return text
 
 
 def _csrf_field(token: str) -> str:
@@ -176,32 +532,157 @@ def _normalize_row(model: ModelSpec, row: dict[str, Any]) -> dict[str, Any]:
     return db_normalize_row(model, row)
 
 
-def _normalize_rows(model: ModelSpec, rows: list[dict[str, Any]]) -> list[dict[str, Any]]:
-    return db_normalize_rows(model, rows)
-
-
 def _ref_label(model: ModelSpec, row: dict[str, Any]) -> str:
-    for field, ftype in model.fields.items():
+    for field, ftype in model.field_items:
         if ftype == "text":
             return str(row.get(field) or row.get("id"))
     return str(row.get("id"))
 
 
+def _ref_label_field(model: ModelSpec) -> str | None:
+    for field, ftype in model.field_items:
+        if ftype == "text":
+            return field
+    return None
+
+
+def _get_ref_labels(
+    conn,
+    model_map: dict[str, ModelSpec],
+    model: ModelSpec,
+    rows: list[dict[str, Any]],
+    fields: list[str],
+) -> dict[str, dict[str, str]]:
+    """Resolve labels only for the ref ids present in `rows`, one IN query per target model."""
+    ref_fields: dict[str, str] = {}
+    wanted: dict[str, set[Any]] = {}
+    for field in fields:
+        target_name = _ref_target_or_none(model.fields.get(field, ""))
+        if target_name is None:
+            continue
+        ref_fields[field] = target_name
+        ids = wanted.setdefault(target_name, set())
+        for row in rows:
+            value = row.get(field)
+            if value not in ("", None):
+                ids.add(value)
+    labels_by_target: dict[str, dict[str, str]] = {}
+    for target_name, ids in wanted.items():
+        target = model_map.get(target_name)
+        if not target or not ids:
+            labels_by_target[target_name] = {}
+            continue
+        label_field = _ref_label_field(target)
+        columns = f"id, {label_field}" if label_field else "id"
+        placeholders = ", ".join(["?"] * len(ids))
+        cursor = conn.execute(f"SELECT {columns} FROM {target.name} WHERE id IN ({placeholders})", tuple(ids))
+        labels: dict[str, str] = {}
+        for found in cursor.fetchall():
+            row_id = found[0]
+            label = found[1] if label_field else None
+            labels[str(row_id)] = str(label or row_id)
+        labels_by_target[target_name] = labels
+    return {field: labels_by_target.get(target_name, {}) for field, target_name in ref_fields.items()}
+
+
 def _get_ref_choices(conn, model_map: dict[str, ModelSpec], model: ModelSpec) -> dict[str, list[tuple[Any, str]]]:
     choices: dict[str, list[tuple[Any, str]]] = {}
     for field, ftype in model.fields.items():
-        if not _is_ref_type(ftype):
+        target_name = _ref_target_or_none(ftype)
+        if target_name is None:
             continue
-        target_name = _ref_target(ftype)
         target = model_map.get(target_name)
         if not target:
             choices[field] = []
             continue
-        rows = list_rows(conn, target, limit=200, offset=0, order_by="id ASC")
+        rows = list_rows(conn, target, limit=_REF_CHOICES_LIMIT, offset=0, order_by="id ASC")
         choices[field] = [(row.get("id"), _ref_label(target, row)) for row in rows]
     return choices
 
 
+_RENDER_CACHE_SIZE = 256
+# <select> inputs for ref fields list at most this many target rows.
+_REF_CHOICES_LIMIT = 200
+
+_COUNT_CACHE: dict[tuple[str, str], tuple[float, int]] = {}
+_COUNT_CACHE_LOCK = threading.Lock()
+
+
+def _cached_counts(conn, app: AppSpec, models: list[ModelSpec], ttl: float = 5.0) -> dict[str, int]:
+    """Row counts per model name; any expired entry refreshes all of them with one UNION ALL query."""
+    now = time.monotonic()
+    counts: dict[str, int] = {}
+    for model in models:
+        cached = _COUNT_CACHE.get((app.db_path, model.name))
+        if cached is None or now - cached[0] >= ttl:
+            break
+        counts[model.name] = cached[1]
+    else:
+        return counts
+    counts = count_rows_many(conn, models)
+    with _COUNT_CACHE_LOCK:
+        for name, count in counts.items():
+            _COUNT_CACHE[(app.db_path, name)] = (now, count)
+    return counts
+
+
+def _invalidate_count(db_path: str, model_name: str | None = None) -> None:
+    # model_name=None drops every cached count for the database (e.g. after an action wrote rows).
+    with _COUNT_CACHE_LOCK:
+        if model_name is not None:
+            _COUNT_CACHE.pop((db_path, model_name), None)
+            return
+        for key in [k for k in _COUNT_CACHE if k[0] == db_path]:
+            _COUNT_CACHE.pop(key, None)
+
+
+def _like_plan(clause: str) -> Callable[[str], tuple[str, Any]]:
+    def plan(raw: str) -> tuple[str, Any]:
+        if "*" in raw or "%" in raw:
+            return clause, raw.replace("*", "%")
+        return clause, f"%{raw}%"
+
+    return plan
+
+
+def _eq_plan(clause: str, coerce: Callable[[str], Any]) -> Callable[[str], tuple[str, Any]]:
+    def plan(raw: str) -> tuple[str, Any]:
+        return clause, coerce(raw)
+
+    return plan
+
+
+def _coerce_bool_filter(value: str) -> int:
+    return 1 if value.lower() in ("1", "true", "yes", "on") else 0
+
+
+def _filter_plan(field: str, field_type: str) -> Callable[[str], tuple[str, Any]]:
+    if field_type == "text" or field_type == "json":
+        return _like_plan(f"{field} LIKE ?")
+    if field_type.startswith("ref:") or field_type == "int":
+        coerce: Callable[[str], Any] = int
+    elif field_type == "float":
+        coerce = float
+    elif field_type == "bool":
+        coerce = _coerce_bool_filter
+    else:
+        coerce = str
+    return _eq_plan(f"{field} = ?", coerce)
+
+
+def _build_filter_plans(model: ModelSpec) -> dict[str, Callable[[str], tuple[str, Any]]]:
+    """Per-field `raw -> (clause, param)` functions with the LIKE/= choice and coercion baked in."""
+    return {field: _filter_plan(field, ftype) for field, ftype in model.fields.items()}
+
+
+def _search_clause(model: ModelSpec) -> tuple[str, int]:
+    """The `q` search clause over the model's text fields and its placeholder count (("", 0) if none)."""
+    text_fields = [f for f, t in model.fields.items() if t == "text"]
+    if not text_fields:
+        return "", 0
+    return "(" + " OR ".join([f"{f} LIKE ?" for f in text_fields]) + ")", len(text_fields)
+
+
 def _select_fields(
     fields: list[str],
     visible_fields: list[str] | None,
@@ -214,12 +695,47 @@ def _select_fields(
     return fields
 
 
+_SECURITY_HEADERS: tuple[tuple[str, str], ...] = (
+    ("X-Content-Type-Options", "nosniff"),
+    ("X-Frame-Options", "DENY"),
+    ("Referrer-Policy", "no-referrer"),
+    ("Permissions-Policy", "interest-cohort=()"),
+)
+
+
+# Fixed 401 bodies, encoded once.
+_AUTH_REQUIRED_BODY = b"Authentication required"
+_API_KEY_REQUIRED_BODY = jsonio.dumps({"error": "API key required"})
+
+
+def _encode_headers(headers: tuple[tuple[str, str], ...]) -> bytes:
+    # Same wire format as BaseHTTPRequestHandler.send_header, built once instead of per response.
+    return b"".join([f"{k}: {v}\r\n".encode("latin-1", "strict") for k, v in headers])
+
+
 class VibeWebServer:
     def __init__(self, spec: AppSpec) -> None:
         self.spec = spec
         self.db_lock = threading.RLock()
         self.conn = connect(spec.db_path, check_same_thread=False)
         ensure_schema(self.conn, spec.models)
+        # Readers are opened after the schema exists; in-memory databases cannot be shared, so they keep one conn.
+        reader_count = int(os.environ.get("VIBEWEB_DB_READERS", "4"))
+        self.readers: list[sqlite3.Connection] = []
+        self.reader_pool: queue.SimpleQueue[sqlite3.Connection] | None = None
+        if reader_count > 0 and not _is_memory_path(spec.db_path):
+            self.readers = [
+                connect(spec.db_path, check_same_thread=False, read_only=True) for _ in range(reader_count)
+            ]
+            self.reader_pool = queue.SimpleQueue()
+            for reader in self.readers:
+                self.reader_pool.put(reader)
+        # PRAGMA data_version on a connection of its own changes whenever any other connection commits,
+        # including other processes (CLI, sqlite shell) that never go through mark_dirty.
+        self.version_conn: sqlite3.Connection | None = None
+        if not _is_memory_path(spec.db_path):
+            self.version_conn = connect(spec.db_path, check_same_thread=False, read_only=True)
+        self.version_lock = threading.Lock()
         self.model_map = {m.name: m for m in spec.models}
         self.page_map = {p.path: p for p in spec.pages}
         self.page_by_model = {}
@@ -232,8 +748,28 @@ class VibeWebServer:
         self.hooks_by_model_event: dict[tuple[str, str], list[HookSpec]] = {}
         for hook in spec.hooks or []:
             self.hooks_by_model_event.setdefault((hook.model, hook.event), []).append(hook)
+        self.ref_targets: dict[str, tuple[str, ...]] = {
+            m.name: tuple(target for t in m.fields.values() if (target := _ref_target_or_none(t)) is not None) for m in spec.models
+        }
+        self.data_versions: dict[str, int] = {m.name: 0 for m in spec.models}
+        self.filter_plans = {m.name: _build_filter_plans(m) for m in spec.models}
+        self.search_clauses = {m.name: _search_clause(m) for m in spec.models}
+        self.sort_fields: dict[str, frozenset[str]] = {m.name: frozenset(("id", *m.fields)) for m in spec.models}
+        # <admin>/<model>[/<id or "create">[/<action>]], tolerating repeated slashes; `rest` holds anything deeper.
+        self.admin_route = re.compile(
+            re.escape(spec.admin_path)
+            + r"/+(?P<model>[^/]+)(?:/+(?P<id>[^/]+)(?:/+(?P<action>[^/]+))?)?/*(?P<rest>.*)",
+            re.DOTALL,
+        )
+        # key -> (html bytes, gzip bytes once a gzip-capable client has asked for it)
+        self.render_cache: OrderedDict[tuple[Any, ...], tuple[bytes, bytes | None]] = OrderedDict()
+        self.render_cache_lock = threading.Lock()
         self.csrf_token = secrets.token_urlsafe(32)
         self.csp = _build_csp(spec)
+        self.security_headers = _encode_headers(_SECURITY_HEADERS)
+        self.html_security_headers = _encode_headers(
+            _SECURITY_HEADERS + (("Content-Security-Policy", self.csp), ("Cache-Control", "no-store"))
+        )
         rate = int(os.environ.get("VIBEWEB_RATE_LIMIT", "120"))
         self.rate_limiter = RateLimiter(rate)
         self.max_body_bytes = int(os.environ.get("VIBEWEB_MAX_BODY_BYTES", "1048576"))
@@ -254,15 +790,96 @@ class VibeWebServer:
         except Exception:
             pass
 
-    def close(self) -> None:
+    def mark_dirty(self, model_name: str | None = None) -> None:
+        """Record a write so cached counts and rendered pages for the model are not reused.
+
+        Without a model name every model is bumped (used after db/flow actions, which may touch any table).
+        """
+        with self.render_cache_lock:
+            names = [model_name] if model_name is not None else list(self.data_versions)
+            for name in names:
+                self.data_versions[name] = self.data_versions.get(name, 0) + 1
+        _invalidate_count(self.spec.db_path, model_name)
+
+    def db_version(self) -> int:
+        """SQLite's data_version for the database file; 0 for in-memory databases (only this process writes)."""
+        conn = self.version_conn
+        if conn is None:
+            return 0
+        with self.version_lock:
+            return conn.execute("PRAGMA data_version").fetchone()[0]
+
+    def data_version(self, model: ModelSpec) -> tuple[int, ...]:
+        # Ref labels come from the target tables, so their writes must invalidate this model's pages too.
+        versions = self.data_versions
+        return (
+            self.db_version(),
+            versions.get(model.name, 0),
+            *(versions.get(t, 0) for t in self.ref_targets.get(model.name, ())),
+        )
+
+    def cached_render(self, key: tuple[Any, ...], *, gzip_ok: bool = False) -> tuple[bytes, bool] | None:
+        """Return `(payload, is_gzipped)` for a cached page, compressing it at most once per entry."""
+        with self.render_cache_lock:
+            entry = self.render_cache.get(key)
+            if entry is None:
+                return None
+            self.render_cache.move_to_end(key)
+        payload, compressed = entry
+        if not gzip_ok:
+            return payload, False
+        if compressed is None:
+            compressed = gzip.compress(payload, compresslevel=6, mtime=0)
+            with self.render_cache_lock:
+                if key in self.render_cache:
+                    self.render_cache[key] = (payload, compressed)
+        return compressed, True
+
+    def store_render(self, key: tuple[Any, ...], payload: bytes) -> None:
+        with self.render_cache_lock:
+            self.render_cache[key] = (payload, None)
+            self.render_cache.move_to_end(key)
+            while len(self.render_cache) > _RENDER_CACHE_SIZE:
+                self.render_cache.popitem(last=False)
+
+    @contextlib.contextmanager
+    def reader(self) -> Iterator[sqlite3.Connection]:
+        """Connection for read-only queries: a pooled reader, or the shared connection under db_lock."""
+        pool = self.reader_pool
+        if pool is None:
+            with self.db_lock:
+                yield self.conn
+            return
+        conn = pool.get()
         try:
-            self.conn.close()
-        except Exception:
-            pass
+            yield conn
+        finally:
+            pool.put(conn)
+
+    def close(self) -> None:
+        for conn in [self.conn, *self.readers, self.version_conn]:
+            if conn is None:
+                continue
+            try:
+                conn.close()
+            except Exception:
+                pass
 
 
 class Handler(BaseHTTPRequestHandler):
     server_ctx: VibeWebServer
+    # Socket read timeout (seconds): an idle or stalled client gives up its worker instead of holding it.
+    timeout = 30.0
+    # Buffered wfile: the header block and a typical body leave together on the flush in _end_headers_with.
+    wbufsize = 64 * 1024
+
+    def setup(self) -> None:
+        super().setup()
+        # Responses go out in one write; don't let Nagle hold the tail of one back waiting for an ACK.
+        try:
+            self.connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        except (OSError, AttributeError):
+            pass
 
     def do_GET(self) -> None:  # noqa: N802
         if not self._check_rate_limit():
@@ -276,7 +893,7 @@ class Handler(BaseHTTPRequestHandler):
             return
         action = self.server_ctx.actions_by_route.get(("GET", parsed.path))
         if action:
-            self._handle_action(action, parsed.query)
+            self._handle_action(action, parsed)
             return
         if parsed.path == "/api/meta":
             if not self._check_api_auth():
@@ -292,7 +909,7 @@ class Handler(BaseHTTPRequestHandler):
         ):
             if not self._check_admin_auth():
                 return
-            self._handle_admin(parsed.path)
+            self._handle_admin(parsed)
             return
         if parsed.path in self.server_ctx.page_map or parsed.path == "/":
             self._handle_ui(parsed.path)
@@ -305,7 +922,7 @@ class Handler(BaseHTTPRequestHandler):
         parsed = urlparse(self.path)
         action = self.server_ctx.actions_by_route.get(("POST", parsed.path))
         if action:
-            self._handle_action(action, parsed.query)
+            self._handle_action(action, parsed)
             return
         if parsed.path.startswith("/api/"):
             self._handle_api_post(parsed.path)
@@ -316,7 +933,7 @@ class Handler(BaseHTTPRequestHandler):
         ):
             if not self._check_admin_auth():
                 return
-            self._handle_admin_post(parsed.path)
+            self._handle_admin_post(parsed)
             return
         self._send_error(HTTPStatus.NOT_FOUND, "Not found")
 
@@ -326,7 +943,7 @@ class Handler(BaseHTTPRequestHandler):
         parsed = urlparse(self.path)
         action = self.server_ctx.actions_by_route.get(("PUT", parsed.path))
         if action:
-            self._handle_action(action, parsed.query)
+            self._handle_action(action, parsed)
             return
         if parsed.path.startswith("/api/"):
             self._handle_api_put(parsed.path)
@@ -342,7 +959,7 @@ class Handler(BaseHTTPRequestHandler):
         parsed = urlparse(self.path)
         action = self.server_ctx.actions_by_route.get(("DELETE", parsed.path))
         if action:
-            self._handle_action(action, parsed.query)
+            self._handle_action(action, parsed)
             return
         if parsed.path.startswith("/api/"):
             self._handle_api_delete(parsed.path)
@@ -382,7 +999,7 @@ class Handler(BaseHTTPRequestHandler):
             },
         }
 
-    def _handle_action(self, action: ActionSpec, query: str) -> None:
+    def _handle_action(self, action: ActionSpec, parsed: ParseResult) -> None:
         if action.auth == "api":
             if not self._check_api_auth():
                 return
@@ -390,8 +1007,7 @@ class Handler(BaseHTTPRequestHandler):
             if not self._check_admin_auth():
                 return
 
-        params = parse_qs(query)
-        query_one = {k: (v[0] if v else "") for k, v in params.items()}
+        query_one = _query_params(parsed.query)
         payload: Any = {}
         if self.command in ("POST", "PUT", "PATCH"):
             data = self._read_payload()
@@ -407,7 +1023,7 @@ class Handler(BaseHTTPRequestHandler):
                     "request": {
                         "ip": self.client_address[0],
                         "method": self.command,
-                        "path": urlparse(self.path).path,
+                        "path": parsed.path,
                     },
                     "actions": self.server_ctx.actions_by_name,
                     "services": {
@@ -428,6 +1044,8 @@ class Handler(BaseHTTPRequestHandler):
             self._send_error(HTTPStatus.INTERNAL_SERVER_ERROR, str(exc))
             return
 
+        if action.kind in ("db", "flow"):
+            self.server_ctx.mark_dirty()
         self._audit(action="action_call", action_name=action.name, ok=result.get("ok"), status=result.get("status"))
         status_code = 200
         try:
@@ -590,6 +1208,8 @@ class Handler(BaseHTTPRequestHandler):
                     error=str(exc),
                 )
                 return
+            if action.kind in ("db", "flow"):
+                self.server_ctx.mark_dirty()
 
             self.server_ctx.audit(
                 ip=ip,
@@ -616,6 +1236,7 @@ class Handler(BaseHTTPRequestHandler):
                 return
             with self.server_ctx.db_lock:
                 update_row(self.server_ctx.conn, model, int(row_id), patch)
+            self.server_ctx.mark_dirty(model.name)
             self.server_ctx.audit(
                 ip=ip,
                 method=method,
@@ -642,43 +1263,29 @@ class Handler(BaseHTTPRequestHandler):
         if not model:
             return
         if row_id is None:
-            params = parse_qs(query)
-            limit = self._int_param(params, "limit", 100)
-            offset = self._int_param(params, "offset", 0)
-            q = params.get("q", [""])[0].strip()
-            sort = params.get("sort", ["id"])[0]
-            direction = params.get("dir", ["desc"])[0]
-            filters = self._parse_filters(model, params)
-            count = params.get("count", ["0"])[0] in ("1", "true", "yes")
-            expand = self._parse_expand(model, params.get("expand", [""])[0])
-            with self.server_ctx.db_lock:
-                rows = self._query_rows(
-                    model,
-                    q=q,
-                    sort=sort,
-                    direction=direction,
-                    limit=limit,
-                    offset=offset,
-                    filters=filters,
-                )
-            data = _normalize_rows(model, rows)
+            opts = self._parse_query(query, model, default_limit=100)
+            count = opts.params.get("count", "0") in ("1", "true", "yes")
+            expand = self._parse_expand(model, opts.params.get("expand", ""))
+            with self.server_ctx.reader() as conn:
+                rows = self._query_rows(conn, model, opts)
+            data = rows
             if expand:
                 data = self._expand_refs(data, model, expand)
             if count:
-                where, params = self._where_clause(model, q, filters)
-                with self.server_ctx.db_lock:
-                    total = count_rows(self.server_ctx.conn, model, where=where, params=params)
-                self._send_json({"data": data, "count": total, "offset": offset, "limit": limit})
+                where, params = self._where_clause(model, opts.q, opts.filters)
+                with self.server_ctx.reader() as conn:
+                    total = count_rows(conn, model, where=where, params=params)
+                self._send_json({"data": data, "count": total, "offset": opts.offset, "limit": opts.limit})
             else:
                 self._send_json(data)
             return
-        with self.server_ctx.db_lock:
-            row = get_row(self.server_ctx.conn, model, row_id)
+        with self.server_ctx.reader() as conn:
+            row = get_row(conn, model, row_id)
         if not row:
             self._send_error(HTTPStatus.NOT_FOUND, "Row not found")
             return
         data = _normalize_row(model, row)
-        expand = self._parse_expand(model, parse_qs(query).get("expand", [""])[0])
+        expand = self._parse_expand(model, _query_params(query).get("expand", ""))
         if expand:
             data = self._expand_refs([data], model, expand)[0]
         self._send_json(data)
@@ -698,6 +1305,7 @@ class Handler(BaseHTTPRequestHandler):
         except Exception as exc:  # noqa: BLE001
             self._send_error(HTTPStatus.BAD_REQUEST, str(exc))
             return
+        self.server_ctx.mark_dirty(model.name)
         self._audit(action="api_create", model=model.name, row_id=row.get("id"))
         self._trigger_hooks(
             "after_create",
@@ -724,6 +1332,7 @@ class Handler(BaseHTTPRequestHandler):
         if not row:
             self._send_error(HTTPStatus.NOT_FOUND, "Row not found")
             return
+        self.server_ctx.mark_dirty(model.name)
         self._audit(action="api_update", model=model.name, row_id=row_id)
         self._trigger_hooks(
             "after_update",
@@ -746,6 +1355,7 @@ class Handler(BaseHTTPRequestHandler):
             old = get_row(self.server_ctx.conn, model, row_id)
             deleted = delete_row(self.server_ctx.conn, model, row_id)
         if deleted:
+            self.server_ctx.mark_dirty(model.name)
             self._audit(action="api_delete", model=model.name, row_id=row_id)
             self._trigger_hooks(
                 "after_delete",
@@ -767,37 +1377,38 @@ class Handler(BaseHTTPRequestHandler):
             self._send_error(HTTPStatus.NOT_FOUND, "No pages configured")
             return
         model = self.server_ctx.model_map[page.model]
-        with self.server_ctx.db_lock:
-            rows = list_rows(self.server_ctx.conn, model, limit=100, offset=0)
-            ref_choices = _get_ref_choices(self.server_ctx.conn, self.server_ctx.model_map, model)
-        html = render_page(self.server_ctx.spec, model, page, _normalize_rows(model, rows), ref_choices=ref_choices)
+        with self.server_ctx.reader() as conn:
+            rows = list_rows_normalized(conn, model, limit=100, offset=0)
+            ref_choices = _get_ref_choices(conn, self.server_ctx.model_map, model)
+        html = render_page(self.server_ctx.spec, model, page, rows, ref_choices=ref_choices)
         self._send_html(html)
 
-    def _handle_admin_post(self, path: str) -> None:
+    def _handle_admin_post(self, parsed: ParseResult) -> None:
+        path = parsed.path
         base = self.server_ctx.spec.admin_path
-        suffix = path[len(base) :].lstrip("/")
-        parts = [p for p in suffix.split("/") if p]
-        if not parts:
+        match = self.server_ctx.admin_route.match(path)
+        if match is None:
             self._send_error(HTTPStatus.NOT_FOUND, "Invalid admin path")
             return
-        model_name = parts[0]
-        if model_name not in self.server_ctx.model_map:
+        model_name, raw_id, admin_action, rest = match.groups()
+        model = self.server_ctx.model_map.get(model_name)
+        if model is None:
             self._send_error(HTTPStatus.NOT_FOUND, "Unknown model")
             return
-        model = self.server_ctx.model_map[model_name]
         payload = self._read_payload()
         if payload is None:
             return
         if not self._require_csrf(payload):
             return
         payload.pop("csrf_token", None)
-        if len(parts) == 2 and parts[1] == "create":
+        if raw_id == "create" and admin_action is None:
             try:
                 with self.server_ctx.db_lock:
                     row = insert_row(self.server_ctx.conn, model, payload)
             except Exception as exc:  # noqa: BLE001
                 self._send_error(HTTPStatus.BAD_REQUEST, str(exc))
                 return
+            self.server_ctx.mark_dirty(model.name)
             self._audit(action="admin_create", model=model.name, row_id=row.get("id"))
             self._trigger_hooks(
                 "after_create",
@@ -809,19 +1420,20 @@ class Handler(BaseHTTPRequestHandler):
             )
             self._redirect(f"{base}/{model_name}")
             return
-        if len(parts) == 3 and parts[2] in ("update", "delete"):
+        if admin_action in ("update", "delete") and not rest:
             try:
-                row_id = int(parts[1])
+                row_id = int(raw_id)
             except ValueError:
                 self._send_error(HTTPStatus.BAD_REQUEST, "Invalid row id")
                 return
-            if parts[2] == "update":
+            if admin_action == "update":
                 with self.server_ctx.db_lock:
                     old = get_row(self.server_ctx.conn, model, row_id)
                     row = update_row(self.server_ctx.conn, model, row_id, payload)
                 if not row:
                     self._send_error(HTTPStatus.NOT_FOUND, "Row not found")
                     return
+                self.server_ctx.mark_dirty(model.name)
                 self._audit(action="admin_update", model=model.name, row_id=row_id)
                 self._trigger_hooks(
                     "after_update",
@@ -834,11 +1446,12 @@ class Handler(BaseHTTPRequestHandler):
                 )
                 self._redirect(f"{base}/{model_name}/{row_id}")
                 return
-            if parts[2] == "delete":
+            if admin_action == "delete":
                 with self.server_ctx.db_lock:
                     old = get_row(self.server_ctx.conn, model, row_id)
                     deleted = delete_row(self.server_ctx.conn, model, row_id)
                 if deleted:
+                    self.server_ctx.mark_dirty(model.name)
                     self._audit(action="admin_delete", model=model.name, row_id=row_id)
                     self._trigger_hooks(
                         "after_delete",
@@ -855,33 +1468,35 @@ class Handler(BaseHTTPRequestHandler):
                 return
         self._send_error(HTTPStatus.NOT_FOUND, "Unknown admin action")
 
-    def _handle_admin(self, path: str) -> None:
+    def _handle_admin(self, parsed: ParseResult) -> None:
+        path = parsed.path
         base = self.server_ctx.spec.admin_path
         if path == base or path == base + "/":
-            html = render_admin_home(self.server_ctx.spec, self.server_ctx.model_map)
+            with self.server_ctx.reader() as conn:
+                html = render_admin_home(self.server_ctx.spec, self.server_ctx.model_map, conn)
             self._send_html(html)
             return
-        suffix = path[len(base) :].lstrip("/")
-        parts = [p for p in suffix.split("/") if p]
-        model_name = parts[0] if parts else ""
-        if not model_name or model_name not in self.server_ctx.model_map:
+        match = self.server_ctx.admin_route.match(path)
+        model = self.server_ctx.model_map.get(match.group("model")) if match else None
+        if model is None:
             self._send_error(HTTPStatus.NOT_FOUND, "Unknown model")
             return
-        model = self.server_ctx.model_map[model_name]
+        model_name = model.name
         page_spec = self.server_ctx.page_by_model.get(model_name)
-        if len(parts) == 2:
+        raw_id = match.group("id")
+        if raw_id is not None and match.group("action") is None:
             try:
-                row_id = int(parts[1])
+                row_id = int(raw_id)
             except ValueError:
                 self._send_error(HTTPStatus.BAD_REQUEST, "Invalid row id")
                 return
-            with self.server_ctx.db_lock:
-                row = get_row(self.server_ctx.conn, model, row_id)
+            with self.server_ctx.reader() as conn:
+                row = get_row(conn, model, row_id)
+                if row:
+                    ref_choices = _get_ref_choices(conn, self.server_ctx.model_map, model)
             if not row:
                 self._send_error(HTTPStatus.NOT_FOUND, "Row not found")
                 return
-            with self.server_ctx.db_lock:
-                ref_choices = _get_ref_choices(self.server_ctx.conn, self.server_ctx.model_map, model)
             html = render_admin_edit(
                 self.server_ctx.spec,
                 model,
@@ -890,51 +1505,50 @@ class Handler(BaseHTTPRequestHandler):
                 ref_choices=ref_choices,
             )
         else:
-            parsed = urlparse(self.path)
-            params = parse_qs(parsed.query)
-            q = params.get("q", [""])[0].strip()
-            if not q and page_spec and page_spec.default_query:
-                q = page_spec.default_query
-            sort = params.get("sort", [None])[0]
-            if not sort:
-                sort = page_spec.default_sort if page_spec and page_spec.default_sort else "id"
-            direction = params.get("dir", [None])[0]
-            if not direction:
-                direction = page_spec.default_dir if page_spec and page_spec.default_dir else "desc"
-            limit = self._int_param(params, "limit", 200)
-            page = self._int_param(params, "page", 1)
-            default_filters = page_spec.default_filters if page_spec else None
-            filters = self._parse_filters(model, params, default_filters=default_filters)
-            offset = max(0, (max(1, page) - 1) * limit)
-            with self.server_ctx.db_lock:
-                rows = self._query_rows(
-                    model,
-                    q=q,
-                    sort=sort,
-                    direction=direction,
-                    limit=limit,
-                    offset=offset,
-                    filters=filters,
-                )
-                where, where_params = self._where_clause(model, q, filters)
-                total = count_rows(self.server_ctx.conn, model, where=where, params=where_params)
-                ref_choices = _get_ref_choices(self.server_ctx.conn, self.server_ctx.model_map, model)
+            opts = self._parse_query(parsed.query, model, default_limit=200, page_spec=page_spec, paged=True)
+            # The version is read before querying so a concurrent write can only make this entry unreachable.
+            cache_key = (
+                "admin_list",
+                model_name,
+                opts.q,
+                opts.sort,
+                opts.direction,
+                tuple(sorted(opts.filters.items())),
+                opts.page,
+                opts.limit,
+                self.server_ctx.data_version(model),
+            )
+            cached = self.server_ctx.cached_render(cache_key, gzip_ok=self._accepts_gzip())
+            if cached is not None:
+                payload, gzipped = cached
+                self._send_html(payload, content_encoding="gzip" if gzipped else None, vary_encoding=True)
+                return
+            with self.server_ctx.reader() as conn:
+                rows = self._query_rows(conn, model, opts)
+                where, where_params = self._where_clause(model, opts.q, opts.filters)
+                total = count_rows(conn, model, where=where, params=where_params)
+                ref_choices = _get_ref_choices(conn, self.server_ctx.model_map, model)
+                ref_labels = _get_ref_labels(conn, self.server_ctx.model_map, model, rows, list(model.fields.keys()))
             html = render_admin_model(
                 self.server_ctx.spec,
                 model,
-                _normalize_rows(model, rows),
-                q=q,
-                sort=sort,
-                direction=direction,
-                filters=filters,
-                page=page,
-                limit=limit,
+                rows,
+                q=opts.q,
+                sort=opts.sort,
+                direction=opts.direction,
+                filters=opts.filters,
+                page=opts.page,
+                limit=opts.limit,
                 total=total,
                 csrf_token=self.server_ctx.csrf_token,
                 ref_choices=ref_choices,
+                ref_labels=ref_labels,
                 visible_fields=page_spec.visible_fields if page_spec else None,
                 hidden_fields=page_spec.hidden_fields if page_spec else None,
-            )
+            ).encode("utf-8")
+            self.server_ctx.store_render(cache_key, html)
+            self._send_html(html, vary_encoding=True)
+            return
         self._send_html(html)
 
     def _read_chunked_body(self, *, max_bytes: int) -> bytes:
@@ -1005,53 +1619,88 @@ class Handler(BaseHTTPRequestHandler):
             if not raw:
                 return {}
             try:
-                return json.loads(raw.decode("utf-8"))
+                return jsonio.loads(raw)
             except Exception:  # noqa: BLE001
                 self._send_error(HTTPStatus.BAD_REQUEST, "Invalid JSON payload")
                 return None
         if content_type == "application/x-www-form-urlencoded":
-            data = parse_qs(raw.decode("utf-8"))
-            return {k: v[0] if len(v) == 1 else v for k, v in data.items()}
+            data: dict[str, Any] = {}
+            for key, value in parse_qsl(raw.decode("utf-8")):
+                prev = data.get(key)
+                if prev is None:
+                    data[key] = value
+                elif isinstance(prev, list):
+                    prev.append(value)
+                else:
+                    # Repeated keys (e.g. multi-selects) keep every value, as parse_qs did.
+                    data[key] = [prev, value]
+            return data
         return {}
 
     def _parse_api_path(self, path: str) -> tuple[Optional[ModelSpec], Optional[int]]:
-        parts = path.split("/")
-        if len(parts) < 3:
+        match = _API_PATH_RE.match(path)
+        if match is None:
             self._send_error(HTTPStatus.NOT_FOUND, "Invalid API path")
             return None, None
-        model_name = parts[2]
-        if model_name not in self.server_ctx.model_map:
+        model_name, raw_id = match.groups()
+        model = self.server_ctx.model_map.get(model_name)
+        if model is None:
             self._send_error(HTTPStatus.NOT_FOUND, f"Unknown model: {model_name}")
             return None, None
         if model_name not in self.server_ctx.spec.api_crud:
             self._send_error(HTTPStatus.FORBIDDEN, f"CRUD disabled for {model_name}")
             return None, None
         row_id = None
-        if len(parts) >= 4 and parts[3]:
+        if raw_id:
             try:
-                row_id = int(parts[3])
+                row_id = int(raw_id)
             except ValueError:
                 self._send_error(HTTPStatus.BAD_REQUEST, "Invalid row id")
                 return None, None
-        return self.server_ctx.model_map[model_name], row_id
+        return model, row_id
 
     def _send_json(self, data: Any, status: HTTPStatus = HTTPStatus.OK) -> None:
-        payload = json.dumps(data, ensure_ascii=False).encode("utf-8")
+        payload = jsonio.dumps(data)
         self.send_response(status)
         self._apply_security_headers()
         self.send_header("Content-Type", "application/json; charset=utf-8")
         self.send_header("Content-Length", str(len(payload)))
-        self.end_headers()
-        self.wfile.write(payload)
+        self._end_headers_with(payload)
 
-    def _send_html(self, html: str, status: HTTPStatus = HTTPStatus.OK) -> None:
-        payload = html.encode("utf-8")
+    def _send_html(
+        self,
+        html: str | bytes,
+        status: HTTPStatus = HTTPStatus.OK,
+        *,
+        content_encoding: str | None = None,
+        vary_encoding: bool = False,
+    ) -> None:
+        payload = html if isinstance(html, bytes) else html.encode("utf-8")
         self.send_response(status)
         self._apply_security_headers(is_html=True)
         self.send_header("Content-Type", "text/html; charset=utf-8")
+        if content_encoding:
+            self.send_header("Content-Encoding", content_encoding)
+        if vary_encoding:
+            self.send_header("Vary", "Accept-Encoding")
         self.send_header("Content-Length", str(len(payload)))
+        self._end_headers_with(payload)
+
+    def _accepts_gzip(self) -> bool:
+        for part in (self.headers.get("Accept-Encoding") or "").split(","):
+            token, _, params = part.partition(";")
+            if token.strip().lower() != "gzip":
+                continue
+            q = params.strip().lower()
+            return not (q.startswith("q=") and q[2:].strip() in ("0", "0.0", "0.00", "0.000"))
+        return False
+
+    def _end_headers_with(self, body: bytes) -> None:
+        """end_headers() plus the body, flushed once so a small response costs one send()."""
         self.end_headers()
-        self.wfile.write(payload)
+        if body:
+            self.wfile.write(body)
+        self.wfile.flush()
 
     def _send_error(self, status: HTTPStatus, message: str) -> None:
         self._send_json({"error": message}, status=status)
@@ -1061,24 +1710,40 @@ class Handler(BaseHTTPRequestHandler):
         if not rel or ".." in rel:
             self._send_error(HTTPStatus.NOT_FOUND, "Not found")
             return
-        base = STATIC_DIR.resolve()
-        file_path = (base / rel).resolve()
-        if not str(file_path).startswith(str(base)) or not file_path.exists():
+        try:
+            file_path = (_STATIC_ROOT / rel).resolve(strict=True)
+        except OSError:
             self._send_error(HTTPStatus.NOT_FOUND, "Not found")
             return
-        content_type = "text/css; charset=utf-8" if file_path.suffix == ".css" else "application/octet-stream"
-        data = file_path.read_bytes()
+        if not file_path.is_relative_to(_STATIC_ROOT):
+            self._send_error(HTTPStatus.NOT_FOUND, "Not found")
+            return
+        try:
+            data, content_type, etag = _load_static(file_path)
+        except OSError:
+            # Directories and files removed since resolve().
+            self._send_error(HTTPStatus.NOT_FOUND, "Not found")
+            return
+        if self.headers.get("If-None-Match") == etag:
+            self.send_response(HTTPStatus.NOT_MODIFIED)
+            self._apply_security_headers()
+            self.send_header("ETag", etag)
+            self.send_header("Cache-Control", "public, max-age=300")
+            self.end_headers()
+            return
         self.send_response(HTTPStatus.OK)
         self._apply_security_headers()
         self.send_header("Content-Type", content_type)
         self.send_header("Content-Length", str(len(data)))
-        self.end_headers()
-        self.wfile.write(data)
+        self.send_header("ETag", etag)
+        self.send_header("Cache-Control", "public, max-age=300")
+        self._end_headers_with(data)
 
     def _redirect(self, location: str) -> None:
         self.send_response(HTTPStatus.SEE_OTHER)
         self._apply_security_headers()
         self.send_header("Location", location)
+        self.send_header("Content-Length", "0")
         self.end_headers()
 
     def _check_admin_auth(self) -> bool:
@@ -1088,6 +1753,15 @@ class Handler(BaseHTTPRequestHandler):
         auth = self.headers.get("Authorization")
         if not auth or not auth.startswith("Basic "):
             return self._send_auth_required()
+        if (
+            expected_user
+            and expected_pass
+            and hmac.compare_digest(
+                auth.encode("utf-8", "surrogateescape"), _basic_auth_header(expected_user, expected_pass)
+            )
+        ):
+            return True
+        # Slow path for equivalent but non-canonical encodings (padding, whitespace).
         try:
             raw = base64.b64decode(auth.split(" ", 1)[1]).decode("utf-8")
         except Exception:
@@ -1126,8 +1800,8 @@ class Handler(BaseHTTPRequestHandler):
         self._apply_security_headers()
         self.send_header("WWW-Authenticate", "Basic realm=\"VibeWeb Admin\"")
         self.send_header("Content-Type", "text/plain; charset=utf-8")
-        self.end_headers()
-        self.wfile.write(b"Authentication required")
+        self.send_header("Content-Length", str(len(_AUTH_REQUIRED_BODY)))
+        self._end_headers_with(_AUTH_REQUIRED_BODY)
         return False
 
     def _check_api_auth(self) -> bool:
@@ -1145,25 +1819,23 @@ class Handler(BaseHTTPRequestHandler):
         self.send_response(HTTPStatus.UNAUTHORIZED)
         self._apply_security_headers()
         self.send_header("Content-Type", "application/json; charset=utf-8")
-        self.end_headers()
-        self.wfile.write(b"{\"error\":\"API key required\"}")
+        self.send_header("Content-Length", str(len(_API_KEY_REQUIRED_BODY)))
+        self._end_headers_with(_API_KEY_REQUIRED_BODY)
         return False
 
     def _parse_filters(
         self,
         model: ModelSpec,
-        params: dict[str, list[str]],
+        params: dict[str, str],
         default_filters: dict[str, str] | None = None,
     ) -> dict[str, str]:
         filters: dict[str, str] = {}
-        for key, values in params.items():
+        for key, raw in params.items():
             if not key.startswith("f_"):
                 continue
             field = key[2:]
-            if field in model.fields and values:
-                raw = values[0]
-                if raw != "":
-                    filters[field] = raw
+            if field in model.fields and raw != "":
+                filters[field] = raw
         if default_filters:
             for field, value in default_filters.items():
                 if f"f_{field}" in params:
@@ -1176,8 +1848,10 @@ class Handler(BaseHTTPRequestHandler):
                         filters[field] = raw
         return filters
 
-    def _int_param(self, params: dict[str, list[str]], name: str, default: int) -> int:
-        raw = params.get(name, [str(default)])[0]
+    def _int_param(self, params: dict[str, str], name: str, default: int) -> int:
+        raw = params.get(name)
+        if raw is None:
+            return default
         try:
             return int(raw)
         except ValueError:
@@ -1199,86 +1873,103 @@ class Handler(BaseHTTPRequestHandler):
             return rows
         for row in rows:
             for field in fields:
-                ftype = model.fields.get(field, "")
-                target_name = _ref_target(ftype) if _is_ref_type(ftype) else ""
+                target_name = _ref_target_or_none(model.fields.get(field, "")) or ""
                 target = self.server_ctx.model_map.get(target_name)
                 ref_id = row.get(field)
                 if not target or ref_id is None:
                     row[f"{field}__ref"] = None
                     continue
-                with self.server_ctx.db_lock:
-                    target_row = get_row(self.server_ctx.conn, target, int(ref_id))
+                with self.server_ctx.reader() as conn:
+                    target_row = get_row(conn, target, int(ref_id))
                 row[f"{field}__ref"] = _normalize_row(target, target_row) if target_row else None
         return rows
 
-    def _coerce_filter_value(self, field_type: str, value: str) -> Any:
-        if field_type.startswith("ref:") or field_type == "int":
-            return int(value)
-        if field_type == "float":
-            return float(value)
-        if field_type == "bool":
-            return 1 if value.lower() in ("1", "true", "yes", "on") else 0
-        return value
-
     def _where_clause(
         self,
         model: ModelSpec,
         q: str,
         filters: dict[str, str],
     ) -> tuple[str, tuple[Any, ...]]:
+        if not q and not filters:
+            return "", ()
         clauses: list[str] = []
         params: list[Any] = []
         if q:
-            text_fields = [f for f, t in model.fields.items() if t == "text"]
-            if text_fields:
-                like = f"%{q}%"
-                clauses.append("(" + " OR ".join([f"{f} LIKE ?" for f in text_fields]) + ")")
-                params.extend([like] * len(text_fields))
-        for field, raw in filters.items():
-            ftype = model.fields.get(field, "text")
-            if ftype == "text" or ftype == "json":
-                if "*" in raw or "%" in raw:
-                    pattern = raw.replace("*", "%")
-                else:
-                    pattern = f"%{raw}%"
-                clauses.append(f"{field} LIKE ?")
-                params.append(pattern)
-            else:
-                clauses.append(f"{field} = ?")
-                params.append(self._coerce_filter_value(ftype, raw))
+            search = self.server_ctx.search_clauses.get(model.name)
+            if search is None:
+                search = _search_clause(model)
+            search_sql, search_params = search
+            if search_params:
+                clauses.append(search_sql)
+                params.extend((f"%{q}%",) * search_params)
+        if filters:
+            plans = self.server_ctx.filter_plans.get(model.name)
+            if plans is None:
+                plans = _build_filter_plans(model)
+            # Field order is normalized so the same filter set always yields the same SQL text,
+            # which keeps sqlite3's per-connection statement cache warm.
+            for field in sorted(filters):
+                raw = filters[field]
+                plan = plans.get(field)
+                if plan is None:
+                    plan = _like_plan(f"{field} LIKE ?")
+                clause, param = plan(raw)
+                clauses.append(clause)
+                params.append(param)
         where = " AND ".join(clauses)
         return where, tuple(params)
 
     def _apply_security_headers(self, *, is_html: bool = False) -> None:
-        self.send_header("X-Content-Type-Options", "nosniff")
-        self.send_header("X-Frame-Options", "DENY")
-        self.send_header("Referrer-Policy", "no-referrer")
-        self.send_header("Permissions-Policy", "interest-cohort=()")
-        if is_html:
-            self.send_header("Content-Security-Policy", self.server_ctx.csp)
-            self.send_header("Cache-Control", "no-store")
-
-    def _query_rows(
+        # flush_headers() moves the status line into the buffered wfile, so the pre-encoded block can follow it
+        # there; later send_header() lines are appended by end_headers().
+        if self.request_version == "HTTP/0.9":
+            return
+        self.flush_headers()
+        ctx = self.server_ctx
+        self.wfile.write(ctx.html_security_headers if is_html else ctx.security_headers)
+
+    def _parse_query(
         self,
+        query: str,
         model: ModelSpec,
         *,
-        q: str,
-        sort: str,
-        direction: str,
-        limit: int,
-        offset: int,
-        filters: dict[str, str],
-    ) -> list[dict[str, Any]]:
-        limit = max(1, min(limit, 500))
-        offset = max(0, offset)
-        allowed_fields = {"id"} | set(model.fields.keys())
-        if sort not in allowed_fields:
-            sort = "id"
-        direction = "asc" if direction.lower() == "asc" else "desc"
+        default_limit: int,
+        page_spec: PageSpec | None = None,
+        paged: bool = False,
+    ) -> QueryOpts:
+        """Parse list options; `paged` derives the offset from `page` (admin) instead of `offset` (API)."""
+        params = _query_params(query)
+        q = params.get("q", "").strip()
+        if not q and page_spec and page_spec.default_query:
+            q = page_spec.default_query
+        # Blank values never reach `params`, so `or` only falls back when the key is missing.
+        sort = params.get("sort") or (page_spec.default_sort if page_spec and page_spec.default_sort else "id")
+        direction = params.get("dir") or (page_spec.default_dir if page_spec and page_spec.default_dir else "desc")
+        limit = self._int_param(params, "limit", default_limit)
+        if paged:
+            page = self._int_param(params, "page", 1)
+            offset = max(0, (max(1, page) - 1) * limit)
+        else:
+            page = 1
+            offset = self._int_param(params, "offset", 0)
+        filters = self._parse_filters(model, params, default_filters=page_spec.default_filters if page_spec else None)
+        return QueryOpts(params, q, sort, direction, limit, offset, page, filters)
+
+    def _query_rows(self, conn: sqlite3.Connection, model: ModelSpec, opts: QueryOpts) -> list[dict[str, Any]]:
+        limit = opts.limit
+        limit = 500 if limit > 500 else 1 if limit < 1 else limit
+        offset = opts.offset if opts.offset > 0 else 0
+        allowed_fields = self.server_ctx.sort_fields.get(model.name)
+        if allowed_fields is None:
+            allowed_fields = frozenset(("id", *model.fields))
+        sort = opts.sort if opts.sort in allowed_fields else "id"
+        # The admin UI only sends lowercase; API callers may not.
+        direction = opts.direction
+        direction = "asc" if direction == "asc" or direction.lower() == "asc" else "desc"
         order_by = f"{sort} {direction}"
-        where, params = self._where_clause(model, q, filters)
-        return list_rows(
-            self.server_ctx.conn,
+        where, params = self._where_clause(model, opts.q, opts.filters)
+        return list_rows_normalized(
+            conn,
             model,
             limit=limit,
             offset=offset,
@@ -1289,33 +1980,16 @@ class Handler(BaseHTTPRequestHandler):
 
 
 def render_shell(app: AppSpec, title: str, body: str, nav_links: list[tuple[str, str]] | None = None) -> str:
-    theme = _theme(app)
-    links = nav_links or []
-    nav = "".join(
-        [
-            f"<a class=\"{theme['nav_link']}\" href=\"{_esc(href)}\">{_esc(label)}</a>"
-            for label, href in links
-        ]
-    )
-    safe_title = _esc(title)
-    safe_name = _esc(app.name)
-    return (
-        "<!doctype html><html><head><meta charset=\"utf-8\"/>"
-        f"<title>{safe_title}</title>"
-        f"{_tailwind_head(app)}"
-        "</head>"
-        f"<body class=\"{theme['body']}\">"
-        f"<div class=\"{theme['grid_overlay']}\"></div>"
-        f"<div class=\"{theme['shell']}\">"
-        f"<div class=\"{theme['container']}\">"
-        f"<div class=\"{theme['topbar']}\">"
-        f"<div class=\"{theme['brand']}\">{safe_name}</div>"
-        f"<nav class=\"{theme['nav']}\">{nav}</nav>"
-        "</div>"
-        f"<main class=\"{theme['surface']}\">"
-        f"{body}</main>"
-        "</div></div></body></html>"
+    prefix, suffix = _shell_parts(app, title, nav_links)
+    return prefix + body + suffix
+
+
+def _shell_parts(app: AppSpec, title: str, nav_links: list[tuple[str, str]] | None) -> tuple[str, str]:
+    frag = _fragments(app)
+    prefix = "".join(
+        [frag.shell_head, _esc(title), frag.shell_after_title, frag.nav(nav_links or []), frag.shell_after_nav]
     )
+    return prefix, frag.shell_close
 
 
 def render_page(
@@ -1326,90 +2000,49 @@ def render_page(
     *,
     ref_choices: dict[str, list[tuple[Any, str]]] | None = None,
 ) -> str:
-    theme = _theme(app)
+    frag = _fragments(app)
+    tpl = frag.tpl
+    model_frag = frag.model(model)
     fields = page.fields or list(model.fields.keys())
     title = page.title or f"{model.name}"
-    safe_title = _esc(title)
-    safe_model = _esc(model.name)
-    header = (
-        f"<header class=\"{theme['header']}\">"
-        f"<div><h1 class=\"{theme['header_title']}\">{safe_title}</h1>"
-        f"<p class=\"{theme['header_subtitle']}\">Auto-generated from {safe_model}</p></div>"
-        f"<span class=\"{theme['header_tag']}\">{safe_model}</span>"
-        "</header>"
-    )
-
-    form_inputs = []
-    for field in fields:
-        ftype = model.fields[field]
-        input_html = _input_for(field, ftype, theme=theme, choices=(ref_choices or {}).get(field))
-        form_inputs.append(input_html)
-    form = (
-        f"<div class=\"{theme['panel']}\">"
-        f"<h2 class=\"{theme['panel_title']}\">Create</h2>"
-        f"<form method=\"post\" action=\"/api/{safe_model}\" "
-        f"enctype=\"application/x-www-form-urlencoded\">"
-        f"<div class=\"{theme['form_grid']}\">"
-        + "".join(form_inputs)
-        + "</div><div class=\"mt-4 flex justify-end\">"
-        f"<button class=\"{theme['btn_primary']}\" "
-        "type=\"submit\">Create</button></div></form></div>"
-    )
-
-    header_row = "".join(
-        [f"<th class=\"{theme['cell']} text-left\">{_esc(f)}</th>" for f in ["id"] + fields]
-    )
-    body_rows = []
+    safe_model = model_frag.safe_name
+    out: list[str] = []
+    append = out.append
+    append(tpl["page_open"].format(safe_title=_esc(title), safe_model=safe_model))
+    append(model_frag.create_inputs(fields, ref_choices or {}))
+    append(tpl["page_table_open"])
+    append(model_frag.header_row(fields))
+    append(tpl["tbody_open"])
+    row_open = frag.row_open
+    cell_next = frag.cell_next
     for row in rows:
-        cells = [f"<td class=\"{theme['cell']}\">{_esc(row.get('id'))}</td>"]
+        append(row_open)
+        append(_esc_text(row.get("id")))
         for field in fields:
-            cells.append(f"<td class=\"{theme['cell']}\">{_esc(row.get(field, ''))}</td>")
-        body_rows.append(f"<tr class=\"{theme['row']}\">" + "".join(cells) + "</tr>")
-    table = (
-        f"<div class=\"{theme['panel']}\">"
-        f"<h2 class=\"{theme['panel_title']}\">Entries</h2>"
-        f"<div class=\"{theme['table_wrap']}\">"
-        f"<table class=\"{theme['table']}\">"
-        f"<thead class=\"{theme['thead']}\"><tr>"
-        + header_row
-        + f"</tr></thead><tbody class=\"{theme['tbody']}\">"
-        + "".join(body_rows)
-        + "</tbody></table></div></div>"
-    )
+            append(cell_next)
+            append(_esc_text(row.get(field, "")))
+        append("</td></tr>")
+    append(tpl["page_close"])
 
     nav_links = []
     if app.admin_enabled:
         nav_links.append(("Admin", app.admin_path))
     nav_links.append(("API", f"/api/{model.name}"))
-    body = f"<div class=\"{theme['stack']}\">" + header + form + table + "</div>"
-    return render_shell(app, title, body, nav_links=nav_links)
+    return render_shell(app, title, "".join(out), nav_links=nav_links)
+
 
-def render_admin_home(app: AppSpec, models: dict[str, ModelSpec]) -> str:
-    theme = _theme(app)
-    conn = connect(app.db_path)
-    cards = []
+def render_admin_home(app: AppSpec, models: dict[str, ModelSpec], conn) -> str:
+    """Render the admin dashboard; ``conn`` is a reader connection (see VibeWebServer.reader) owned by the caller."""
+    frag = _fragments(app)
+    out: list[str] = [frag.tpl["home_open"]]
+    append = out.append
+    card = frag.tpl["home_card"]
+    counts = _cached_counts(conn, app, list(models.values())) if models else {}
     for model in models.values():
-        count = count_rows(conn, model)
-        safe_model = _esc(model.name)
-        cards.append(
-            f"<div class=\"{theme['card']}\">"
-            f"<h3 class=\"{theme['card_title']}\">{safe_model}</h3>"
-            f"<p class=\"mt-2\"><span class=\"{theme['badge']}\">{count} rows</span></p>"
-            f"<p class=\"mt-4 flex gap-3 text-sm font-semibold\">"
-            f"<a class=\"{theme['link']}\" href=\"{_esc(app.admin_path)}/{safe_model}\">Manage</a>"
-            f"<a class=\"{theme['link_muted']}\" href=\"/api/{safe_model}\">API</a></p>"
-            "</div>"
-        )
-    conn.close()
-    header = (
-        f"<header class=\"{theme['header']}\">"
-        f"<div><h1 class=\"{theme['header_title']}\">Admin</h1>"
-        f"<p class=\"{theme['header_subtitle']}\">System overview</p></div>"
-        f"<span class=\"{theme['header_tag']}\">Dashboard</span></header>"
-    )
-    body = header + f"<div class=\"{theme['grid']}\">" + "".join(cards) + "</div>"
+        append(card.format(safe_model=frag.model(model).safe_name, count=counts.get(model.name, 0)))
+    append("</div>")
     nav_links = [("Home", "/")]
-    return render_shell(app, "Admin", body, nav_links=nav_links)
+    return render_shell(app, "Admin", "".join(out), nav_links=nav_links)
 
 
 def render_admin_model(
@@ -1426,121 +2059,80 @@ def render_admin_model(
     total: int,
     csrf_token: str,
     ref_choices: dict[str, list[tuple[Any, str]]],
+    ref_labels: dict[str, dict[str, str]] | None = None,
     visible_fields: list[str] | None = None,
     hidden_fields: list[str] | None = None,
 ) -> str:
-    theme = _theme(app)
-    safe_model = _esc(model.name)
-    safe_q = _esc(q)
+    frag = _fragments(app)
+    tpl = frag.tpl
+    model_frag = frag.model(model)
+    safe_model = model_frag.safe_name
+    csrf_field = _csrf_field(csrf_token)
     title = f"{model.name} Admin"
-    header = (
-        f"<header class=\"{theme['header']}\">"
-        f"<div><h1 class=\"{theme['header_title']}\">{safe_model}</h1>"
-        f"<p class=\"text-xs uppercase tracking-[0.3em] text-slate-500\">/{safe_model}</p></div>"
-        f"<span class=\"{theme['header_tag']}\">{len(rows)} rows</span></header>"
-    )
     fields = list(model.fields.keys())
     table_fields = _select_fields(fields, visible_fields, hidden_fields)
-    form_inputs = [
-        _input_for(field, model.fields[field], theme=theme, choices=ref_choices.get(field)) for field in fields
+    out: list[str] = []
+    append = out.append
+    append(tpl["admin_model_open"].format(safe_model=safe_model, row_count=len(rows), csrf_field=csrf_field))
+    append(model_frag.create_inputs(fields, ref_choices))
+    append(tpl["admin_model_search"].format(safe_q=_esc(q)))
+    append(model_frag.sort_select(sort, direction))
+    append(tpl["admin_model_filters"])
+    for field, render_filter in model_frag.filter_inputs.items():
+        append(render_filter(filters.get(field, ""), ref_choices.get(field)))
+    append(tpl["admin_model_table"].format(limit=_esc(limit)))
+    append(model_frag.header_row(table_fields))
+    append(tpl["admin_model_tbody"])
+    ref_label_map = ref_labels
+    if ref_label_map is None:
+        ref_label_map = {field: {str(opt_id): label for opt_id, label in options} for field, options in ref_choices.items()}
+    row_open = frag.row_open
+    cell_next = frag.cell_next
+    edit_open = "</td>" + tpl["admin_row_edit"].format(safe_model=safe_model)
+    delete_open = tpl["admin_row_delete"].format(safe_model=safe_model)
+    delete_close = tpl["admin_row_close"].format(csrf_field=csrf_field)
+    # (field, label map or None for non-ref fields), resolved once instead of per cell.
+    field_plans = [
+        (field, ref_label_map.get(field, {}) if _is_ref_type(model.fields.get(field, "")) else None)
+        for field in table_fields
     ]
-    form = (
-        f"<div class=\"{theme['panel']}\">"
-        f"<h2 class=\"{theme['panel_title']}\">Create</h2>"
-        f"<form method=\"post\" action=\"{_esc(app.admin_path)}/{safe_model}/create\" "
-        f"enctype=\"application/x-www-form-urlencoded\">"
-        f"{_csrf_field(csrf_token)}"
-        f"<div class=\"{theme['form_grid']}\">"
-        + "".join(form_inputs)
-        + "</div><div class=\"mt-4 flex justify-end\">"
-        f"<button class=\"{theme['btn_primary']}\" "
-        "type=\"submit\">Create</button></div></form></div>"
-    )
-    filter_inputs = []
-    for field in fields:
-        ftype = model.fields[field]
-        value = filters.get(field, "")
-        filter_inputs.append(
-            _filter_input_for(field, ftype, theme=theme, value=value, choices=ref_choices.get(field))
-        )
-    search = (
-        f"<div class=\"{theme['panel']}\">"
-        f"<h2 class=\"{theme['panel_title']}\">Filter</h2>"
-        "<form method=\"get\" action=\"\">"
-        "<div class=\"mt-4 flex flex-wrap items-end gap-4\">"
-        f"<label class=\"{theme['label']}\">"
-        f"Query<input class=\"{theme['input']}\" "
-        f"name=\"q\" value=\"{safe_q}\" placeholder=\"Search\"/></label>"
-        + _sort_select(model, sort, direction, theme=theme)
-        + f"<button class=\"{theme['btn_dark']}\" "
-        "type=\"submit\">Apply</button>"
-        + "</div>"
-        + f"<div class=\"mt-4 grid gap-4 md:grid-cols-2 lg:grid-cols-3\">{''.join(filter_inputs)}</div>"
-        + f"<input type=\"hidden\" name=\"limit\" value=\"{_esc(limit)}\"/>"
-        + "</form></div>"
-    )
-    header_row = "".join(
-        [f"<th class=\"{theme['cell']} text-left\">{f}</th>" for f in ["id"] + table_fields]
-    )
-    header_row += f"<th class=\"{theme['cell']} text-left\">Actions</th>"
-    ref_label_map: dict[str, dict[str, str]] = {}
-    for field, options in ref_choices.items():
-        ref_label_map[field] = {str(opt_id): label for opt_id, label in options}
-    body_rows = []
     for row in rows:
         row_id = _esc(row.get("id"))
-        cells = [f"<td class=\"{theme['cell']}\">{row_id}</td>"]
-        for field in table_fields:
+        append(row_open)
+        append(row_id)
+        for field, label_map in field_plans:
             value = row.get(field, "")
-            ftype = model.fields.get(field, "")
-            if _is_ref_type(ftype) and value not in ("", None):
-                label = ref_label_map.get(field, {}).get(str(value))
-                display = f"{_esc(value)}" if not label else f"{_esc(value)} · {_esc(label)}"
-                cells.append(f"<td class=\"{theme['cell']}\">{display}</td>")
-            else:
-                cells.append(f"<td class=\"{theme['cell']}\">{_esc(value)}</td>")
-        actions = (
-            f"<td class=\"{theme['cell']}\"><a class=\"{theme['link']}\" "
-            f"href=\"{_esc(app.admin_path)}/{safe_model}/{row_id}\">Edit</a>"
-            f" <form method=\"post\" action=\"{_esc(app.admin_path)}/{safe_model}/{row_id}/delete\""
-            " style=\"display:inline\">"
-            f"{_csrf_field(csrf_token)}"
-            f"<button class=\"{theme['btn_outline']}\" type=\"submit\">Delete</button></form></td>"
-        )
-        body_rows.append(f"<tr class=\"{theme['row']}\">" + "".join(cells) + actions + "</tr>")
-    table = (
-        f"<div class=\"{theme['panel']}\">"
-        f"<h2 class=\"{theme['panel_title']}\">Rows</h2>"
-        f"<div class=\"{theme['table_wrap']}\">"
-        f"<table class=\"{theme['table']}\"><thead "
-        f"class=\"{theme['thead']}\"><tr>"
-        + header_row
-        + f"</tr></thead><tbody class=\"{theme['tbody']}\">"
-        + "".join(body_rows)
-        + "</tbody></table></div></div>"
-    )
+            append(cell_next)
+            append(_esc_text(value))
+            if label_map is not None and value not in ("", None):
+                label = label_map.get(str(value))
+                if label:
+                    append(" · ")
+                    append(_esc_text(label))
+        append(edit_open)
+        append(row_id)
+        append(delete_open)
+        append(row_id)
+        append(delete_close)
     total_pages = max(1, math.ceil(total / max(1, limit)))
     page = max(1, min(page, total_pages))
     base_params = {"q": q, "sort": sort, "dir": direction, "limit": str(limit)}
     for field, value in filters.items():
         base_params[f"f_{field}"] = value
-    def _page_link(target: int) -> str:
-        params = dict(base_params)
-        params["page"] = str(target)
-        return "?" + urlencode(params)
-    prev_disabled = "opacity-40 pointer-events-none" if page <= 1 else ""
-    next_disabled = "opacity-40 pointer-events-none" if page >= total_pages else ""
-    pagination = (
-        f"<div class=\"mt-4 flex items-center justify-between text-xs text-slate-600\">"
-        f"<span>Page {page} of {total_pages} · {total} total</span>"
-        f"<div class=\"flex gap-2\">"
-        f"<a class=\"{theme['btn_outline']} {prev_disabled}\" href=\"{_page_link(page - 1)}\">Prev</a>"
-        f"<a class=\"{theme['btn_outline']} {next_disabled}\" href=\"{_page_link(page + 1)}\">Next</a>"
-        f"</div></div>"
+    append(
+        tpl["admin_model_pagination"].format(
+            page=page,
+            total_pages=total_pages,
+            total=total,
+            prev_disabled="opacity-40 pointer-events-none" if page <= 1 else "",
+            next_disabled="opacity-40 pointer-events-none" if page >= total_pages else "",
+            base_qs="?" + urlencode(base_params) + "&page=",
+            prev_page=page - 1,
+            next_page=page + 1,
+        )
     )
     nav_links = [("Admin", app.admin_path), ("API", f"/api/{model.name}")]
-    body = f"<div class=\"{theme['stack']}\">" + header + form + search + table + pagination + "</div>"
-    return render_shell(app, title, body, nav_links=nav_links)
+    return render_shell(app, title, "".join(out), nav_links=nav_links)
 
 
 def render_admin_edit(
@@ -1551,158 +2143,247 @@ def render_admin_edit(
     csrf_token: str,
     ref_choices: dict[str, list[tuple[Any, str]]],
 ) -> str:
-    theme = _theme(app)
-    safe_model = _esc(model.name)
-    safe_id = _esc(row.get("id"))
+    frag = _fragments(app)
+    tpl = frag.tpl
+    model_frag = frag.model(model)
+    bool_inputs = model_frag.bool_inputs
     title = f"Edit {model.name}"
-    header = (
-        f"<header class=\"{theme['header']}\">"
-        f"<div><h1 class=\"{theme['header_title']}\">{safe_model} #{safe_id}</h1>"
-        f"<p class=\"{theme['header_subtitle']}\">Edit entry</p></div>"
-        f"<span class=\"{theme['header_tag']}\">Edit</span></header>"
+    out: list[str] = []
+    append = out.append
+    append(
+        tpl["edit_open"].format(
+            safe_model=model_frag.safe_name,
+            safe_id=_esc(row.get("id")),
+            csrf_field=_csrf_field(csrf_token),
+        )
     )
-    inputs = []
-    for field, ftype in model.fields.items():
+    for field, ftype in model.field_items:
         value = row.get(field, "")
-        inputs.append(_input_for(field, ftype, theme=theme, value=value, choices=ref_choices.get(field)))
-    form = (
-        f"<div class=\"{theme['panel']}\">"
-        f"<h2 class=\"{theme['panel_title']}\">Update</h2>"
-        f"<form method=\"post\" action=\"{_esc(app.admin_path)}/{safe_model}/{safe_id}/update\" "
-        f"enctype=\"application/x-www-form-urlencoded\">"
-        f"{_csrf_field(csrf_token)}"
-        f"<div class=\"{theme['form_grid']}\">"
-        + "".join(inputs)
-        + "</div><div class=\"mt-4 flex justify-end\">"
-        f"<button class=\"{theme['btn_dark']}\" "
-        "type=\"submit\">Update</button></div></form></div>"
-    )
+        if ftype == "bool":
+            append(bool_inputs[field][str(value) in _BOOL_TRUE])
+        else:
+            append(_input_for(field, ftype, tpl=tpl, value=value, choices=ref_choices.get(field)))
+    append(tpl["edit_close"])
     nav_links = [("Admin", app.admin_path), ("Back", f"{app.admin_path}/{model.name}")]
-    body = f"<div class=\"{theme['stack']}\">" + header + form + "</div>"
-    return render_shell(app, title, body, nav_links=nav_links)
+    return render_shell(app, title, "".join(out), nav_links=nav_links)
+
+
+@functools.lru_cache(maxsize=8)
+def _basic_auth_header(username: str, password: str) -> bytes:
+    """The canonical `Basic <base64>` Authorization value for the admin credentials, built once."""
+    return b"Basic " + base64.b64encode(f"{username}:{password}".encode("utf-8"))
+
+
+@functools.lru_cache(maxsize=1024)
+def _options_html(choices: tuple[tuple[Any, str], ...]) -> str:
+    # Rendered without any `selected` marker; _select_options splices it in per request.
+    return "".join([f"<option value=\"{_esc(opt_value)}\" >{_esc(label)}</option>" for opt_value, label in choices])
+
+
+def _select_options(choices: list[tuple[Any, str]] | None, selected_value: str) -> str:
+    options = _options_html(tuple(choices or ()))
+    marker = f"<option value=\"{_esc(selected_value)}\" >"
+    return options.replace(marker, f"<option value=\"{_esc(selected_value)}\" selected>")
+
+
+_BOOL_TRUE = frozenset(("1", "true", "True"))
+_BOOL_INPUT_OPTIONS = {
+    True: "<option value=\"0\" >false</option><option value=\"1\" selected>true</option>",
+    False: "<option value=\"0\" selected>false</option><option value=\"1\" >true</option>",
+}
+_BOOL_FILTER_OPTIONS = {
+    "1": "<option value=\"\">Any</option><option value=\"1\" selected>true</option><option value=\"0\" >false</option>",
+    "0": "<option value=\"\">Any</option><option value=\"1\" >true</option><option value=\"0\" selected>false</option>",
+    "": "<option value=\"\">Any</option><option value=\"1\" >true</option><option value=\"0\" >false</option>",
+}
+
+
+_INPUT_TYPES = {"int": "number", "float": "number", "datetime": "datetime-local"}
+
 
 def _input_for(
     name: str,
     field_type: str,
     *,
-    theme: dict[str, str],
+    tpl: dict[str, str],
     value: Any = "",
     choices: list[tuple[Any, str]] | None = None,
 ) -> str:
+    safe_name = _esc(name)
     if _is_ref_type(field_type):
-        options = [("<option value=\"\">--</option>")]
         selected_value = "" if value is None else str(value)
-        for opt_value, label in (choices or []):
-            selected = "selected" if str(opt_value) == selected_value else ""
-            options.append(
-                f"<option value=\"{_esc(opt_value)}\" {selected}>{_esc(label)}</option>"
-            )
-        return (
-            f"<label class=\"{theme['label']}\">{_esc(name)}"
-            f"<select class=\"{theme['input']}\" name=\"{_esc(name)}\">"
-            + "".join(options)
-            + "</select></label>"
-        )
+        return tpl["input_ref"].format(safe_name=safe_name, options=_select_options(choices, selected_value))
     if field_type == "bool":
-        selected = "selected" if str(value) in ("1", "true", "True") else ""
-        selected_false = "" if selected else "selected"
-        return (
-            f"<label class=\"{theme['label']}\">"
-            f"{_esc(name)}<select class=\"{theme['input']}\" name=\"{_esc(name)}\">"
-            f"<option value=\"0\" {selected_false}>false</option>"
-            f"<option value=\"1\" {selected}>true</option>"
-            "</select></label>"
+        return tpl["input_bool"].format(
+            safe_name=safe_name, options=_BOOL_INPUT_OPTIONS[str(value) in _BOOL_TRUE]
         )
     if field_type == "json":
         if isinstance(value, (dict, list)):
             safe_value = _esc(json.dumps(value, ensure_ascii=False, indent=2))
         else:
             safe_value = _esc(value)
-        return (
-            f"<label class=\"{theme['label']}\">{_esc(name)}"
-            f"<textarea class=\"{theme['input']}\" name=\"{_esc(name)}\" rows=\"4\">"
-            f"{safe_value}</textarea></label>"
-        )
-    input_type = "text"
-    if field_type in ("int", "float"):
-        input_type = "number"
-    if field_type == "datetime":
-        input_type = "datetime-local"
+        return tpl["input_json"].format(safe_name=safe_name, safe_value=safe_value)
     safe_value = _esc(value)
-    value_attr = f"value=\"{safe_value}\"" if safe_value != "" else ""
-    return (
-        f"<label class=\"{theme['label']}\">{_esc(name)}"
-        f"<input class=\"{theme['input']}\" name=\"{_esc(name)}\" type=\"{input_type}\" {value_attr}/>"
-        "</label>"
+    return tpl["input_plain"].format(
+        safe_name=safe_name,
+        input_type=_INPUT_TYPES.get(field_type, "text"),
+        value_attr=f"value=\"{safe_value}\"" if safe_value != "" else "",
     )
 
 
-def _filter_input_for(
-    name: str,
-    field_type: str,
-    *,
-    theme: dict[str, str],
-    value: Any = "",
-    choices: list[tuple[Any, str]] | None = None,
-) -> str:
+def _filter_input_renderer(name: str, field_type: str, *, theme: dict[str, str]) -> Callable[[Any, Any], str]:
+    """Build `render(value, choices) -> html` for one filter input with its constant markup pre-rendered."""
     field_name = f"f_{name}"
+    select_open = (
+        f"<label class=\"{theme['label']}\">{_esc(name)}"
+        f"<select class=\"{theme['input']}\" name=\"{_esc(field_name)}\">"
+    )
     if _is_ref_type(field_type):
-        options = ["<option value=\"\">Any</option>"]
-        selected_value = str(value) if value is not None else ""
-        for opt_value, label in (choices or []):
-            selected = "selected" if str(opt_value) == selected_value else ""
-            options.append(
-                f"<option value=\"{_esc(opt_value)}\" {selected}>{_esc(label)}</option>"
-            )
-        return (
-            f"<label class=\"{theme['label']}\">{_esc(name)}"
-            f"<select class=\"{theme['input']}\" name=\"{_esc(field_name)}\">"
-            + "".join(options)
-            + "</select></label>"
-        )
+        ref_open = select_open + "<option value=\"\">Any</option>"
+
+        def render_ref(value: Any, choices: list[tuple[Any, str]] | None) -> str:
+            selected_value = str(value) if value is not None else ""
+            return ref_open + _select_options(choices, selected_value) + "</select></label>"
+
+        return render_ref
     if field_type == "bool":
-        options = [
-            "<option value=\"\">Any</option>",
-            f"<option value=\"1\" {'selected' if str(value) == '1' else ''}>true</option>",
-            f"<option value=\"0\" {'selected' if str(value) == '0' else ''}>false</option>",
-        ]
-        return (
-            f"<label class=\"{theme['label']}\">{_esc(name)}"
-            f"<select class=\"{theme['input']}\" name=\"{_esc(field_name)}\">"
-            + "".join(options)
-            + "</select></label>"
-        )
-    safe_value = _esc(value)
-    return (
+        variants = {key: select_open + options + "</select></label>" for key, options in _BOOL_FILTER_OPTIONS.items()}
+
+        def render_bool(value: Any, choices: list[tuple[Any, str]] | None) -> str:
+            return variants.get(str(value), variants[""])
+
+        return render_bool
+    input_open = (
         f"<label class=\"{theme['label']}\">{_esc(name)}"
         f"<input class=\"{theme['input']}\" name=\"{_esc(field_name)}\" "
-        f"type=\"text\" value=\"{safe_value}\"/></label>"
+        "type=\"text\" value=\""
     )
 
+    def render_text(value: Any, choices: list[tuple[Any, str]] | None) -> str:
+        return input_open + _esc(value) + "\"/></label>"
+
+    return render_text
+
+
+def _sort_select_renderer(model: ModelSpec, *, theme: dict[str, str]) -> Callable[[str, str], str]:
+    """Build `render(sort, direction) -> html` for the admin sort controls with the theme lookups done once."""
+    sort_fields = ["id", *model.fields.keys()]
+    plain = [f"<option value=\"{_esc(field)}\" >{_esc(field)}</option>" for field in sort_fields]
+    options = "".join(plain)
+    # Option list with each field pre-selected, so a render is a lookup and a few concatenations.
+    by_sort: dict[str, str] = {}
+    for i, field in enumerate(sort_fields):
+        chosen = f"<option value=\"{_esc(field)}\" selected>{_esc(field)}</option>"
+        by_sort.setdefault(field, "".join(plain[:i]) + chosen + "".join(plain[i + 1 :]))
+    head = f"<label class=\"{theme['label']}\">Sort<div class=\"flex gap-2\"><select class=\"{theme['input']}\" name=\"sort\">"
+    dir_open = f"</select><select class=\"{theme['input']}\" name=\"dir\">"
+    dir_options = {
+        "asc": "<option value=\"asc\" selected>asc</option><option value=\"desc\" >desc</option>",
+        "desc": "<option value=\"asc\" >asc</option><option value=\"desc\" selected>desc</option>",
+    }
+    dir_none = "<option value=\"asc\" >asc</option><option value=\"desc\" >desc</option>"
+    tail = "</select></div></label>"
+
+    def render(sort: str, direction: str) -> str:
+        return head + by_sort.get(sort, options) + dir_open + dir_options.get(direction, dir_none) + tail
+
+    return render
+
+
+def _load_static(file_path: Path) -> tuple[bytes, str, str]:
+    """Return (body, content type, ETag) for a static file, re-reading it only when its mtime changes."""
+    mtime_ns = os.stat(file_path).st_mtime_ns
+    cached = _STATIC_CACHE.get(file_path)
+    if cached is not None and cached[0] == mtime_ns:
+        return cached[1], cached[2], cached[3]
+    data = file_path.read_bytes()
+    content_type = _STATIC_TYPES.get(file_path.suffix, "application/octet-stream")
+    etag = f"\"{hashlib.sha1(data).hexdigest()[:20]}\""
+    with _STATIC_CACHE_LOCK:
+        _STATIC_CACHE[file_path] = (mtime_ns, data, content_type, etag)
+    return data, content_type, etag
+
+
+_BUSY_BODY = jsonio.dumps({"error": "Server busy"})
+# Written straight to the socket by the accept loop when no worker can take a connection.
+_BUSY_RESPONSE = (
+    b"HTTP/1.0 503 Service Unavailable\r\n"
+    b"Content-Type: application/json; charset=utf-8\r\n"
+    + f"Content-Length: {len(_BUSY_BODY)}\r\n".encode("ascii")
+    + b"Retry-After: 1\r\nConnection: close\r\n\r\n"
+    + _BUSY_BODY
+)
 
-def _sort_select(model: ModelSpec, sort: str, direction: str, *, theme: dict[str, str]) -> str:
-    fields = ["id"] + list(model.fields.keys())
-    options = []
-    for field in fields:
-        selected = "selected" if field == sort else ""
-        options.append(f"<option value=\"{_esc(field)}\" {selected}>{_esc(field)}</option>")
-    dir_selected = "selected" if direction == "desc" else ""
-    dir_selected_asc = "selected" if direction == "asc" else ""
-    return (
-        f"<label class=\"{theme['label']}\">Sort"
-        "<div class=\"flex gap-2\">"
-        + f"<select class=\"{theme['input']}\" name=\"sort\">{''.join(options)}</select>"
-        + f"<select class=\"{theme['input']}\" name=\"dir\"><option value=\"asc\" {dir_selected_asc}>asc</option>"
-        + f"<option value=\"desc\" {dir_selected}>desc</option></select>"
-        + "</div></label>"
-    )
+
+class _WorkerPoolHTTPServer(HTTPServer):
+    """HTTPServer that hands accepted connections to a fixed pool of worker threads.
+
+    Threads are started once instead of per connection. The accept loop never blocks on them: once every
+    worker is busy and the hand-off queue is full, new connections get a 503 and are closed.
+    """
+
+    # socketserver's default listen backlog is 5; bursts beyond it are refused while every worker is busy.
+    request_queue_size = 128
+
+    def __init__(self, server_address, handler_class, *, max_threads: int) -> None:
+        workers = max(1, max_threads)
+        self._requests: queue.Queue[tuple[Any, Any] | None] = queue.Queue(maxsize=workers)
+        self._workers = [threading.Thread(target=self._work, daemon=True) for _ in range(workers)]
+        super().__init__(server_address, handler_class)
+        for worker in self._workers:
+            worker.start()
+
+    def process_request(self, request, client_address) -> None:
+        try:
+            self._requests.put_nowait((request, client_address))
+        except queue.Full:
+            try:
+                request.setblocking(False)
+                request.sendall(_BUSY_RESPONSE)
+            except OSError:
+                pass
+            self.shutdown_request(request)
+
+    def _work(self) -> None:
+        while True:
+            item = self._requests.get()
+            if item is None:
+                return
+            request, client_address = item
+            try:
+                self.finish_request(request, client_address)
+            except Exception:
+                self.handle_error(request, client_address)
+            finally:
+                self.shutdown_request(request)
+
+    def server_close(self) -> None:
+        super().server_close()
+        # Connections still waiting for a worker will not be served; close them rather than leak them.
+        while True:
+            try:
+                item = self._requests.get_nowait()
+            except queue.Empty:
+                break
+            if item is not None:
+                self.shutdown_request(item[0])
+        for worker in self._workers:
+            if not worker.is_alive():
+                continue
+            try:
+                self._requests.put_nowait(None)
+            except queue.Full:
+                # Workers are daemon threads; any still busy exit with the process.
+                break
 
 
 def run_server(spec: AppSpec, host: str = "127.0.0.1", port: int = 8000) -> None:
     ctx = VibeWebServer(spec)
     try:
         Handler.server_ctx = ctx
-        httpd = ThreadingHTTPServer((host, port), Handler)
+        Handler.timeout = float(os.environ.get("VIBEWEB_REQUEST_TIMEOUT", "30"))
+        max_threads = int(os.environ.get("VIBEWEB_MAX_THREADS", "64"))
+        httpd = _WorkerPoolHTTPServer((host, port), Handler, max_threads=max_threads)
         print(f"VibeWeb running on http://{host}:{port}")
         httpd.serve_forever()
     finally:
@@ -1,57 +1,173 @@
-import json
-import re
+import hashlib
+import os
+import pickle
+import sys
+import threading
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Dict, List
-from urllib.parse import urlparse
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Sequence, Tuple
+
+from vibeweb import jsonio
 
 SPEC_VERSION = 1
 
 
-ALLOWED_TYPES = {"text", "int", "float", "bool", "datetime", "json"}
-ALLOWED_ACTION_KINDS = {"http", "llm", "db", "flow", "value"}
-ALLOWED_ACTION_METHODS = {"GET", "POST", "PUT", "PATCH", "DELETE"}
-ALLOWED_ACTION_AUTH = {"api", "none", "admin"}
-ALLOWED_DB_OPS = {"get", "list", "insert", "update", "delete"}
-ALLOWED_HOOK_EVENTS = {
-    "after_create",
-    "after_update",
-    "after_delete",
-}
-ALLOWED_HOOK_MODES = {"sync", "async"}
+# Read-only allow-lists. Their literals are interned, so values interned at load compare by identity.
+ALLOWED_TYPES = frozenset({"text", "int", "float", "bool", "datetime", "json"})
+ALLOWED_ACTION_KINDS = frozenset({"http", "llm", "db", "flow", "value"})
+ALLOWED_ACTION_METHODS = frozenset({"GET", "POST", "PUT", "PATCH", "DELETE"})
+ALLOWED_ACTION_AUTH = frozenset({"api", "none", "admin"})
+ALLOWED_DB_OPS = frozenset({"get", "list", "insert", "update", "delete"})
+ALLOWED_HOOK_EVENTS = frozenset(
+    {
+        "after_create",
+        "after_update",
+        "after_delete",
+    }
+)
+ALLOWED_HOOK_MODES = frozenset({"sync", "async"})
+
+# URL prefix served from vibeweb/static; action paths may not shadow it.
+_STATIC_PREFIX = "/static/"
+# Valid action.value.status codes; int-in-range membership is a constant-time C check.
+_HTTP_STATUSES = range(100, 600)
 
-_SAFE_IDENT_RE = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*$")
+
+def _intern(value: str) -> str:
+    # sys.intern() rejects str subclasses (e.g. StrEnum members); those are stored as a plain str.
+    return sys.intern(value if type(value) is str else str.__str__(value))
 
 
 def _require_ident(value: str, *, what: str) -> None:
-    if not _SAFE_IDENT_RE.match(value):
+    # ASCII identifiers are exactly ^[A-Za-z_][A-Za-z0-9_]*$, checked in C without the regex engine
+    # (and without `$` letting a trailing newline through).
+    if not (value.isidentifier() and value.isascii()):
         raise ValueError(f"{what} must match ^[A-Za-z_][A-Za-z0-9_]*$: {value!r}")
 
 
-_ALLOWED_COND_OPS = {
-    "$and",
-    "$or",
-    "$not",
-    "$eq",
-    "$ne",
-    "$gt",
-    "$gte",
-    "$lt",
-    "$lte",
-    "$in",
-    "$contains",
-    "$startsWith",
-    "$endsWith",
-    "$regex",
-    "$any",
-    "$all",
-    "$exists",
-    "$truthy",
+# Shared stand-ins for absent sections, so validation does not allocate an empty dict/list per lookup.
+_EMPTY_OBJ: Mapping[str, Any] = MappingProxyType({})
+
+
+def _get_obj(parent: Mapping[str, Any], key: str, *, what: str) -> Mapping[str, Any]:
+    """parent[key] as an object; missing or falsy values read as empty."""
+    value = parent.get(key)
+    if not value:
+        return _EMPTY_OBJ
+    if not isinstance(value, dict):
+        raise ValueError(f"{what} must be an object")
+    return value
+
+
+def _get_list(parent: Mapping[str, Any], key: str, *, what: str) -> Sequence[Any]:
+    """parent[key] as a list; missing or falsy values read as empty."""
+    value = parent.get(key)
+    if not value:
+        return ()
+    if not isinstance(value, list):
+        raise ValueError(f"{what} must be a list")
+    return value
+
+
+def _is_https_url(url: str) -> bool:
+    """True for an https:// URL with a host; plain lowercase URLs skip urlparse entirely."""
+    if url.startswith("https://"):
+        end = len(url)
+        for sep in "/?#":
+            pos = url.find(sep, 8)
+            if pos != -1 and pos < end:
+                end = pos
+        host = url[8:end]
+        if host and host.isascii() and host.isprintable() and "[" not in host and "]" not in host:
+            return True
+    # Anything unusual (upper-case scheme, IPv6 literals, non-ASCII or control characters) gets the full parser.
+    from urllib.parse import urlparse
+
+    parsed = urlparse(url)
+    return parsed.scheme == "https" and bool(parsed.netloc)
+
+
+# Plain loops: these run for every list/dict in the spec, and a generator under all() costs
+# about twice as much per call.
+def _is_str_list(value: Any) -> bool:
+    if not isinstance(value, list):
+        return False
+    for item in value:
+        if not isinstance(item, str):
+            return False
+    return True
+
+
+def _is_str_dict(value: Any) -> bool:
+    if not isinstance(value, dict):
+        return False
+    for key, item in value.items():
+        if not isinstance(key, str) or not isinstance(item, str):
+            return False
+    return True
+
+
+def _first_unknown(names: Iterable[str], known: frozenset[str]) -> str | None:
+    """First of names (in order) missing from known; the all-known case is one C-level issuperset()."""
+    if known.issuperset(names):
+        return None
+    for name in names:
+        if name not in known:
+            return name
+    return None
+
+
+# $operator -> argument shape, so validation is one dict lookup per operator node.
+_COND_LOGICAL, _COND_NOT, _COND_BINARY, _COND_EXISTS, _COND_TRUTHY = range(5)
+_COND_OPS: Dict[str, int] = {
+    "$and": _COND_LOGICAL,
+    "$or": _COND_LOGICAL,
+    "$not": _COND_NOT,
+    "$eq": _COND_BINARY,
+    "$ne": _COND_BINARY,
+    "$gt": _COND_BINARY,
+    "$gte": _COND_BINARY,
+    "$lt": _COND_BINARY,
+    "$lte": _COND_BINARY,
+    "$in": _COND_BINARY,
+    "$contains": _COND_BINARY,
+    "$startsWith": _COND_BINARY,
+    "$endsWith": _COND_BINARY,
+    "$regex": _COND_BINARY,
+    "$any": _COND_BINARY,
+    "$all": _COND_BINARY,
+    "$exists": _COND_EXISTS,
+    "$truthy": _COND_TRUTHY,
 }
+_ALLOWED_COND_OPS = frozenset(_COND_OPS)
+# Binary operators whose second operand has a fixed type -> (type, error detail).
+_COND_OPERAND_TYPES: Dict[str, Tuple[type, str]] = {
+    "$regex": (str, "pattern must be a string"),
+    "$in": (list, "expects [expr, [values...]]"),
+    "$startsWith": (str, "expects [expr, string]"),
+    "$endsWith": (str, "expects [expr, string]"),
+    "$any": (dict, "expects [expr, <condition_object>]"),
+    "$all": (dict, "expects [expr, <condition_object>]"),
+}
+# Binary operators whose second operand is itself a condition, evaluated per list item.
+_COND_NESTED_OPERAND = frozenset({"$any", "$all"})
 
 
 def _is_op_condition(value: dict[str, Any]) -> bool:
-    return any(isinstance(k, str) and k.startswith("$") for k in value.keys())
+    # Same rule as conditions._is_op_dict: any "$" key makes it operator form. A plain loop
+    # stops at the first such key without the generator set-up any() would need.
+    for k in value:
+        if isinstance(k, str) and k.startswith("$"):
+            return True
+    return False
+
+
+# Conditions are evaluated recursively at request time (conditions.eval_condition), so bound
+# both nesting and total size here rather than letting a hostile spec reach the interpreter.
+_COND_MAX_DEPTH = 64
+_COND_MAX_NODES = 10_000
 
 
 def _validate_condition(value: Any, *, what: str) -> None:
@@ -62,100 +178,100 @@ def _validate_condition(value: Any, *, what: str) -> None:
       - Equality maps: {"row.stage": "Closed Won", "steps.invoice.ok": true}
       - Operator forms: {"$and": [...]}, {"$eq": ["expr", value]}, ...
       - List form (implicit AND): [cond, cond, ...]
+
+    Walks the tree with an explicit stack (children pushed in reverse, so errors are reported
+    in document order) and rejects conditions nested deeper than _COND_MAX_DEPTH or with more
+    than _COND_MAX_NODES nodes.
     """
-    if value is None:
-        return
-    if isinstance(value, bool):
-        return
-    if isinstance(value, list):
-        for item in value:
-            _validate_condition(item, what=what)
-        return
-    if not isinstance(value, dict):
-        raise ValueError(f"{what} must be an object or list")
+    stack: List[Tuple[Any, int]] = [(value, 0)]
+    nodes = 0
+    while stack:
+        value, depth = stack.pop()
+        nodes += 1
+        if nodes > _COND_MAX_NODES:
+            raise ValueError(f"{what} is too large (more than {_COND_MAX_NODES} nodes)")
+        if depth > _COND_MAX_DEPTH:
+            raise ValueError(f"{what} is nested too deeply (more than {_COND_MAX_DEPTH} levels)")
+
+        if value is None:
+            continue
+        if isinstance(value, bool):
+            continue
+        if isinstance(value, list):
+            stack.extend((item, depth + 1) for item in reversed(value))
+            continue
+        if not isinstance(value, dict):
+            raise ValueError(f"{what} must be an object or list")
+
+        if not _is_op_condition(value):
+            for key in value.keys():
+                if not isinstance(key, str) or not key:
+                    raise ValueError(f"{what} keys must be non-empty strings")
+            continue
+
+        if len(value) != 1:
+            raise ValueError(f"{what} operator form must have exactly one $operator key")
+
+        op, arg = next(iter(value.items()))
+        kind = _COND_OPS.get(op) if isinstance(op, str) else None
+        if kind is None:
+            raise ValueError(f"{what} has unknown operator: {op!r}")
+
+        if kind == _COND_LOGICAL:
+            if not isinstance(arg, list) or not arg:
+                raise ValueError(f"{what}.{op} must be a non-empty list")
+            stack.extend((item, depth + 1) for item in reversed(arg))
+            continue
+
+        if kind == _COND_NOT:
+            stack.append((arg, depth + 1))
+            continue
+
+        if kind == _COND_BINARY:
+            if not isinstance(arg, list) or len(arg) != 2:
+                raise ValueError(f"{what}.{op} must be [expr, value]")
+            expr = arg[0]
+            if not isinstance(expr, str) or not expr:
+                raise ValueError(f"{what}.{op} expr must be a non-empty string")
+            operand = _COND_OPERAND_TYPES.get(op)
+            if operand is not None and not isinstance(arg[1], operand[0]):
+                raise ValueError(f"{what}.{op} {operand[1]}")
+            if op in _COND_NESTED_OPERAND:
+                stack.append((arg[1], depth + 1))
+            continue
+
+        if kind == _COND_EXISTS:
+            if isinstance(arg, str) and arg:
+                continue
+            if (
+                isinstance(arg, list)
+                and len(arg) == 2
+                and isinstance(arg[0], str)
+                and arg[0]
+                and isinstance(arg[1], bool)
+            ):
+                continue
+            raise ValueError(f"{what}.$exists expects 'expr' or ['expr', bool]")
 
-    if not _is_op_condition(value):
-        for key in value.keys():
-            if not isinstance(key, str) or not key:
-                raise ValueError(f"{what} keys must be non-empty strings")
-        return
-
-    if len(value) != 1:
-        raise ValueError(f"{what} operator form must have exactly one $operator key")
-
-    op, arg = next(iter(value.items()))
-    if not isinstance(op, str) or op not in _ALLOWED_COND_OPS:
-        raise ValueError(f"{what} has unknown operator: {op!r}")
-
-    if op in ("$and", "$or"):
-        if not isinstance(arg, list) or not arg:
-            raise ValueError(f"{what}.{op} must be a non-empty list")
-        for item in arg:
-            _validate_condition(item, what=what)
-        return
-
-    if op == "$not":
-        _validate_condition(arg, what=what)
-        return
-
-    if op in (
-        "$eq",
-        "$ne",
-        "$gt",
-        "$gte",
-        "$lt",
-        "$lte",
-        "$in",
-        "$contains",
-        "$startsWith",
-        "$endsWith",
-        "$regex",
-        "$any",
-        "$all",
-    ):
-        if not isinstance(arg, list) or len(arg) != 2:
-            raise ValueError(f"{what}.{op} must be [expr, value]")
-        expr = arg[0]
-        if not isinstance(expr, str) or not expr:
-            raise ValueError(f"{what}.{op} expr must be a non-empty string")
-        if op == "$regex" and not isinstance(arg[1], str):
-            raise ValueError(f"{what}.$regex pattern must be a string")
-        if op == "$in" and not isinstance(arg[1], list):
-            raise ValueError(f"{what}.$in expects [expr, [values...]]")
-        if op in ("$startsWith", "$endsWith") and not isinstance(arg[1], str):
-            raise ValueError(f"{what}.{op} expects [expr, string]")
-        if op in ("$any", "$all") and not isinstance(arg[1], dict):
-            raise ValueError(f"{what}.{op} expects [expr, <condition_object>]")
-        return
-
-    if op == "$exists":
-        if isinstance(arg, str) and arg:
-            return
-        if (
-            isinstance(arg, list)
-            and len(arg) == 2
-            and isinstance(arg[0], str)
-            and arg[0]
-            and isinstance(arg[1], bool)
-        ):
-            return
-        raise ValueError(f"{what}.$exists expects 'expr' or ['expr', bool]")
-
-    if op == "$truthy":
         if not isinstance(arg, str) or not arg:
             raise ValueError(f"{what}.$truthy expects 'expr'")
-        return
 
-    raise ValueError(f"{what} has unsupported operator: {op!r}")
 
-
-@dataclass
+@dataclass(slots=True)
 class ModelSpec:
     name: str
     fields: Dict[str, str]
+    # (name, type) pairs in declaration order, for the loops that walk every field.
+    field_items: Tuple[Tuple[str, str], ...] = field(init=False, repr=False, compare=False)
+    # Field names (without the implicit "id"), shared by every validator that checks references.
+    field_names: frozenset[str] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self.field_items = tuple(self.fields.items())
+        self.field_names = frozenset(self.fields)
 
 
-@dataclass
+@dataclass(slots=True)
 class PageSpec:
     path: str
     model: str
@@ -169,7 +285,7 @@ class PageSpec:
     hidden_fields: List[str] | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class HttpActionSpec:
     url: str
     method: str | None = None
@@ -180,7 +296,7 @@ class HttpActionSpec:
     expect: str = "auto"  # auto|json|text
 
 
-@dataclass
+@dataclass(slots=True)
 class LlmActionSpec:
     provider: str = "openai"  # openai|ollama
     base_url: str | None = None
@@ -194,7 +310,7 @@ class LlmActionSpec:
     output: str = "text"  # text|json
 
 
-@dataclass
+@dataclass(slots=True)
 class DbActionSpec:
     op: str  # get|list|insert|update|delete
     model: str
@@ -206,14 +322,14 @@ class DbActionSpec:
     order_by: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ValueActionSpec:
     data: Any
     status: int = 200
     ok: bool = True
 
 
-@dataclass
+@dataclass(slots=True)
 class FlowStepSpec:
     id: str
     use: str
@@ -226,14 +342,14 @@ class FlowStepSpec:
     parallel: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class FlowActionSpec:
     steps: List[FlowStepSpec] = field(default_factory=list)
     return_step: str | None = None
     vars: Dict[str, Any] | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ActionSpec:
     name: str
     kind: str = "http"
@@ -247,7 +363,7 @@ class ActionSpec:
     flow: FlowActionSpec | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class HookSpec:
     model: str
     event: str
@@ -258,7 +374,7 @@ class HookSpec:
     when: Any | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class AppSpec:
     name: str
     spec_version: int = SPEC_VERSION
@@ -279,18 +395,376 @@ class AppSpec:
 
 
 def load_spec(path: str) -> Dict[str, Any]:
-    data = json.loads(Path(path).read_text(encoding="utf-8"))
+    data = jsonio.loads(Path(path).read_bytes())
     if not isinstance(data, dict):
         raise ValueError("Spec must be an object")
     return data
 
 
+# blake2b digest of the raw spec bytes -> pickled AppSpec validated from them, least recently used first.
+# Entries are pickled so every load gets its own mutable AppSpec; unpickling costs about half a validation.
+_SPEC_CACHE: "OrderedDict[bytes, bytes]" = OrderedDict()
+_SPEC_CACHE_SIZE = 128
+_SPEC_CACHE_LOCK = threading.Lock()
+# Absolute spec path -> (st_mtime_ns, st_size, digest) of the bytes last loaded from it.
+_SPEC_MTIMES: Dict[str, Tuple[int, int, bytes]] = {}
+
+
+def _spec_digest(raw: bytes) -> bytes:
+    return hashlib.blake2b(raw, digest_size=16).digest()
+
+
+def _cached_app(key: bytes) -> AppSpec | None:
+    with _SPEC_CACHE_LOCK:
+        blob = _SPEC_CACHE.get(key)
+        if blob is None:
+            return None
+        _SPEC_CACHE.move_to_end(key)
+    return pickle.loads(blob)
+
+
+def _store_app(key: bytes, app: AppSpec) -> None:
+    blob = pickle.dumps(app, protocol=pickle.HIGHEST_PROTOCOL)
+    with _SPEC_CACHE_LOCK:
+        _SPEC_CACHE[key] = blob
+        _SPEC_CACHE.move_to_end(key)
+        while len(_SPEC_CACHE) > _SPEC_CACHE_SIZE:
+            _SPEC_CACHE.popitem(last=False)
+
+
+def clear_spec_cache() -> None:
+    """Forget every AppSpec memoized by load_app_spec."""
+    with _SPEC_CACHE_LOCK:
+        _SPEC_CACHE.clear()
+        _SPEC_MTIMES.clear()
+
+
+def load_app_spec(path: str) -> AppSpec:
+    """Load and validate a spec file, skipping both steps while its mtime and size are unchanged.
+
+    Each call returns a fresh AppSpec, so callers may modify theirs without affecting other loads.
+    """
+    abs_path = os.path.abspath(path)
+    st = os.stat(abs_path)
+    stamp = (st.st_mtime_ns, st.st_size)
+    seen = _SPEC_MTIMES.pop(abs_path, None)
+    if seen is not None:
+        app = _cached_app(seen[2]) if seen[:2] == stamp else None
+        if app is not None:
+            _SPEC_MTIMES[abs_path] = seen
+            return app
+    raw = Path(abs_path).read_bytes()
+    key = _spec_digest(raw)
+    app = _cached_app(key)
+    if app is None:
+        data = jsonio.loads(raw)
+        if not isinstance(data, dict):
+            raise ValueError("Spec must be an object")
+        app = validate_spec(data)
+        _store_app(key, app)
+    _SPEC_MTIMES[abs_path] = (*stamp, key)
+    return app
+
+
+def _ref_target_or_none(field_type: str) -> str | None:
+    """Target model of a ``ref:<Model>`` field type, or None for any other type."""
+    return field_type[4:] if field_type.startswith("ref:") and len(field_type) > 4 else None
+
+
 def _is_ref_type(field_type: str) -> bool:
-    return field_type.startswith("ref:") and len(field_type.split(":", 1)[1]) > 0
+    return _ref_target_or_none(field_type) is not None
+
+
+# Shared shape rules for the timeout_s/retries knobs that http, llm and flow steps all accept.
+_RETRIES = range(0, 11)
+
+
+def _check_timeout(value: Any, *, what: str) -> int:
+    if not isinstance(value, int) or value < 1:
+        raise ValueError(f"{what} must be an int >= 1")
+    return value
+
+
+def _check_retries(value: Any, *, what: str) -> int:
+    if not isinstance(value, int) or value not in _RETRIES:
+        raise ValueError(f"{what} must be an int between 0 and 10")
+    return value
+
+
+@dataclass(slots=True)
+class _ActionContext:
+    """What the per-kind action validators need from the rest of the spec."""
+
+    action_name: str
+    action_names: set[str]
+    model_names: frozenset[str]
+    model_fields_by_name: Dict[str, frozenset[str]]
+    strings: Dict[str, str]
+
+
+def _validate_http_action(raw: Dict[str, Any], ctx: _ActionContext) -> HttpActionSpec:
+    http_raw = raw.get("http", raw.get("request")) or raw.get("http_request") or {}
+    if not isinstance(http_raw, dict):
+        raise ValueError("action.http must be an object")
+    url = http_raw.get("url") or raw.get("url")
+    if not isinstance(url, str) or not url:
+        raise ValueError("action.http.url must be a string")
+    headers = http_raw.get("headers") or {}
+    if not _is_str_dict(headers):
+        raise ValueError("action.http.headers must be an object of string:string")
+    body = http_raw.get("body", None)
+    timeout_s = _check_timeout(http_raw.get("timeout_s", 30), what="action.http.timeout_s")
+    retries = _check_retries(http_raw.get("retries", 0), what="action.http.retries")
+    expect = http_raw.get("expect", "auto")
+    if not isinstance(expect, str) or expect not in ("auto", "json", "text"):
+        raise ValueError("action.http.expect must be 'auto', 'json', or 'text'")
+    http_method = http_raw.get("method")
+    if http_method is not None:
+        if not isinstance(http_method, str) or http_method.upper() not in ALLOWED_ACTION_METHODS:
+            raise ValueError(f"action.http.method must be one of {sorted(ALLOWED_ACTION_METHODS)}")
+        http_method = sys.intern(http_method.upper())
+    return HttpActionSpec(
+        url=url,
+        method=http_method,
+        headers=_share_strings(headers, ctx.strings),
+        body=body,
+        timeout_s=timeout_s,
+        retries=retries,
+        expect=expect,
+    )
 
 
-def _ref_target(field_type: str) -> str:
-    return field_type.split(":", 1)[1]
+def _validate_llm_action(raw: Dict[str, Any], ctx: _ActionContext) -> LlmActionSpec:
+    llm_raw = _get_obj(raw, "llm", what="action.llm")
+    provider = llm_raw.get("provider", "openai")
+    if not isinstance(provider, str) or provider.lower() not in ("openai", "ollama"):
+        raise ValueError("action.llm.provider must be 'openai' or 'ollama'")
+    base_url = llm_raw.get("base_url")
+    if base_url is not None and not isinstance(base_url, str):
+        raise ValueError("action.llm.base_url must be a string")
+    model = llm_raw.get("model")
+    if model is not None and not isinstance(model, str):
+        raise ValueError("action.llm.model must be a string")
+    api_key_env = llm_raw.get("api_key_env", "VIBEWEB_AI_API_KEY")
+    if not isinstance(api_key_env, str) or not api_key_env:
+        raise ValueError("action.llm.api_key_env must be a string")
+    messages = llm_raw.get("messages") or []
+    if not isinstance(messages, list):
+        raise ValueError("action.llm.messages must be a list")
+    for msg in messages:
+        if not isinstance(msg, dict):
+            raise ValueError("action.llm.messages items must be objects")
+        role = msg.get("role")
+        content = msg.get("content")
+        if role not in ("system", "user", "assistant"):
+            raise ValueError("action.llm.messages.role must be system|user|assistant")
+        if not isinstance(content, str):
+            raise ValueError("action.llm.messages.content must be a string")
+    temperature = llm_raw.get("temperature", 0.2)
+    if not isinstance(temperature, (int, float)) or temperature < 0 or temperature > 2:
+        raise ValueError("action.llm.temperature must be between 0 and 2")
+    max_tokens = llm_raw.get("max_tokens")
+    if max_tokens is not None:
+        if not isinstance(max_tokens, int) or max_tokens < 1:
+            raise ValueError("action.llm.max_tokens must be int >= 1")
+    timeout_s = _check_timeout(llm_raw.get("timeout_s", 60), what="action.llm.timeout_s")
+    retries = _check_retries(llm_raw.get("retries", 0), what="action.llm.retries")
+    output = llm_raw.get("output", "text")
+    if not isinstance(output, str) or output not in ("text", "json"):
+        raise ValueError("action.llm.output must be 'text' or 'json'")
+    return LlmActionSpec(
+        provider=provider.lower(),
+        base_url=base_url,
+        model=model,
+        api_key_env=api_key_env,
+        messages=messages,
+        temperature=float(temperature),
+        max_tokens=max_tokens,
+        timeout_s=timeout_s,
+        retries=retries,
+        output=output,
+    )
+
+
+def _validate_db_action(raw: Dict[str, Any], ctx: _ActionContext) -> DbActionSpec:
+    db_raw = _get_obj(raw, "db", what="action.db")
+    op = db_raw.get("op")
+    if not isinstance(op, str) or op not in ALLOWED_DB_OPS:
+        raise ValueError(f"action.db.op must be one of {sorted(ALLOWED_DB_OPS)}")
+    db_model = db_raw.get("model")
+    if not isinstance(db_model, str) or db_model not in ctx.model_names:
+        raise ValueError("action.db.model must reference a known model")
+
+    model_fields = ctx.model_fields_by_name.get(db_model)
+
+    def _validate_field_dict(value: Any, label: str) -> Dict[str, Any]:
+        if not isinstance(value, dict):
+            raise ValueError(f"action.db.{label} must be an object")
+        if model_fields:
+            for key in value.keys():
+                if key not in model_fields:
+                    raise ValueError(f"action.db.{label} contains unknown field '{key}' for {db_model}")
+        return value  # type: ignore[return-value]
+
+    row_id = db_raw.get("id")
+    data = db_raw.get("data")
+    patch = db_raw.get("patch")
+    limit = int(db_raw.get("limit", 100))
+    offset = int(db_raw.get("offset", 0))
+    order_by = db_raw.get("order_by")
+    if order_by is not None and not isinstance(order_by, str):
+        raise ValueError("action.db.order_by must be a string")
+    if limit < 1 or limit > 1000:
+        raise ValueError("action.db.limit must be between 1 and 1000")
+    if offset < 0:
+        raise ValueError("action.db.offset must be >= 0")
+
+    if op == "insert":
+        if data is None:
+            raise ValueError("action.db.data is required for op=insert")
+        data = _validate_field_dict(data, "data")
+        if not data:
+            raise ValueError("action.db.data must include at least one field")
+    elif op == "update":
+        if row_id is None or not isinstance(row_id, (str, int)):
+            raise ValueError("action.db.id is required for op=update (string or int)")
+        if patch is None:
+            raise ValueError("action.db.patch is required for op=update")
+        patch = _validate_field_dict(patch, "patch")
+    elif op in ("get", "delete"):
+        if row_id is None or not isinstance(row_id, (str, int)):
+            raise ValueError(f"action.db.id is required for op={op} (string or int)")
+    elif op == "list":
+        pass
+
+    return DbActionSpec(
+        op=op,
+        model=db_model,
+        id=row_id,
+        data=data if isinstance(data, dict) else None,
+        patch=patch if isinstance(patch, dict) else None,
+        limit=limit,
+        offset=offset,
+        order_by=order_by,
+    )
+
+
+def _validate_value_action(raw: Dict[str, Any], ctx: _ActionContext) -> ValueActionSpec:
+    value_raw = raw.get("value")
+    if not isinstance(value_raw, dict):
+        raise ValueError("action.value must be an object")
+    if "data" not in value_raw:
+        raise ValueError("action.value.data is required (can be null)")
+    status = value_raw.get("status", 200)
+    ok = value_raw.get("ok", True)
+    if not isinstance(status, int) or status not in _HTTP_STATUSES:
+        raise ValueError("action.value.status must be an int between 100 and 599")
+    if not isinstance(ok, bool):
+        raise ValueError("action.value.ok must be a boolean")
+    return ValueActionSpec(
+        data=value_raw.get("data"),
+        status=int(status),
+        ok=bool(ok),
+    )
+
+
+def _validate_flow_action(raw: Dict[str, Any], ctx: _ActionContext) -> FlowActionSpec:
+    flow_raw = _get_obj(raw, "flow", what="action.flow")
+    flow_vars = flow_raw.get("vars")
+    if flow_vars is not None:
+        if not isinstance(flow_vars, dict):
+            raise ValueError("action.flow.vars must be an object")
+        for key in flow_vars.keys():
+            if not isinstance(key, str) or not key:
+                raise ValueError("action.flow.vars keys must be strings")
+            _require_ident(key, what="flow vars key")
+    steps_raw = flow_raw.get("steps") or []
+    if not isinstance(steps_raw, list) or not steps_raw:
+        raise ValueError("action.flow.steps must be a non-empty list")
+    steps: List[FlowStepSpec] = []
+    step_ids: set[str] = set()
+    for step_raw in steps_raw:
+        if not isinstance(step_raw, dict):
+            raise ValueError("flow step must be an object")
+        step_id = step_raw.get("id")
+        if not isinstance(step_id, str) or not step_id:
+            raise ValueError("flow step.id must be a string")
+        _require_ident(step_id, what="flow step.id")
+        if step_id in step_ids:
+            raise ValueError(f"duplicate flow step id: {step_id}")
+        step_ids.add(step_id)
+        use = step_raw.get("use")
+        if not isinstance(use, str) or not use:
+            raise ValueError("flow step.use must be a string")
+        if use == ctx.action_name:
+            raise ValueError("flow step.use cannot reference the flow action itself")
+        if use not in ctx.action_names:
+            raise ValueError(f"flow step.use references unknown action: {use}")
+        when = step_raw.get("when")
+        if when is not None:
+            _validate_condition(when, what="flow step.when")
+
+        step_retries = _check_retries(step_raw.get("retries", 0), what="flow step.retries")
+        step_timeout = step_raw.get("timeout_s")
+        if step_timeout is not None:
+            _check_timeout(step_timeout, what="flow step.timeout_s")
+        step_parallel = step_raw.get("parallel", False)
+        if not isinstance(step_parallel, bool):
+            raise ValueError("flow step.parallel must be a boolean")
+
+        on_error = step_raw.get("on_error")
+        if on_error is not None:
+            if not isinstance(on_error, str) or on_error not in ("stop", "continue", "return"):
+                raise ValueError("flow step.on_error must be one of: stop, continue, return")
+
+        set_raw = step_raw.get("set")
+        if set_raw is not None:
+            if not isinstance(set_raw, dict):
+                raise ValueError("flow step.set must be an object")
+            for key in set_raw.keys():
+                if not isinstance(key, str) or not key:
+                    raise ValueError("flow step.set keys must be strings")
+                _require_ident(key, what="flow step.set key")
+        steps.append(
+            FlowStepSpec(
+                id=step_id,
+                use=_intern(use),
+                input=step_raw.get("input"),
+                when=when,
+                on_error=_intern(on_error) if on_error is not None else None,
+                set=set_raw,
+                retries=int(step_retries),
+                timeout_s=int(step_timeout) if isinstance(step_timeout, int) else None,
+                parallel=bool(step_parallel),
+            )
+        )
+    return_step = flow_raw.get("return_step", flow_raw.get("return"))
+    if return_step is not None:
+        if not isinstance(return_step, str) or not return_step:
+            raise ValueError("action.flow.return_step must be a string")
+        if return_step not in step_ids:
+            raise ValueError("action.flow.return_step must be one of flow step ids")
+    return FlowActionSpec(steps=steps, return_step=return_step, vars=flow_vars)
+
+
+# action.kind -> validator for its sub-object; the result is stored on the ActionSpec field named after the kind.
+_ACTION_VALIDATORS: Dict[str, Callable[[Dict[str, Any], _ActionContext], Any]] = {
+    "http": _validate_http_action,
+    "llm": _validate_llm_action,
+    "db": _validate_db_action,
+    "value": _validate_value_action,
+    "flow": _validate_flow_action,
+}
+
+
+def _share_strings(mapping: Mapping[Any, Any], strings: Dict[str, str]) -> Dict[str, str]:
+    """str-valued copy of a validated mapping: keys interned, equal values sharing one object."""
+    share = strings.setdefault
+    out: Dict[str, str] = {}
+    for key, value in mapping.items():
+        value = str(value)
+        out[_intern(key)] = share(value, value)
+    return out
 
 
 def validate_spec(spec: Dict[str, Any]) -> AppSpec:
@@ -304,30 +778,19 @@ def validate_spec(spec: Dict[str, Any]) -> AppSpec:
     if not isinstance(name, str):
         raise ValueError("name must be a string")
 
-    db = spec.get("db", {}) or {}
-    if not isinstance(db, dict):
-        raise ValueError("db must be an object")
+    db = _get_obj(spec, "db", what="db")
     db_path = db.get("path") or "vibeweb.db"
     if not isinstance(db_path, str):
         raise ValueError("db.path must be a string")
 
-    models_raw = db.get("models", []) or []
-    if not isinstance(models_raw, list):
-        raise ValueError("db.models must be a list")
-
-    model_names: set[str] = set()
-    for model in models_raw:
-        if not isinstance(model, dict):
-            raise ValueError("model must be an object")
-        model_name = model.get("name")
-        if not isinstance(model_name, str) or not model_name:
-            raise ValueError("model.name must be a string")
-        _require_ident(model_name, what="model.name")
-        if model_name in model_names:
-            raise ValueError(f"duplicate model name: {model_name}")
-        model_names.add(model_name)
+    models_raw = _get_list(db, "models", what="db.models")
 
+    # Header values and theme classes repeat across actions/pages; keep one copy of each.
+    strings: Dict[str, str] = {}
+    names: set[str] = set()
     models: List[ModelSpec] = []
+    # (model, field, target) for ref fields; checked once every model name is known.
+    refs: List[Tuple[str, str, str]] = []
     for model in models_raw:
         if not isinstance(model, dict):
             raise ValueError("model must be an object")
@@ -335,49 +798,54 @@ def validate_spec(spec: Dict[str, Any]) -> AppSpec:
         if not isinstance(model_name, str) or not model_name:
             raise ValueError("model.name must be a string")
         _require_ident(model_name, what="model.name")
+        if model_name in names:
+            raise ValueError(f"duplicate model name: {model_name}")
+        model_name = _intern(model_name)
+        names.add(model_name)
 
         fields = model.get("fields")
         if not isinstance(fields, dict) or not fields:
             raise ValueError(f"model.fields required for {model_name}")
+        # Rebuilt with interned names/types: specs repeat the same few type strings, and the server's
+        # per-row dict lookups and type comparisons then hit the identity fast path.
+        interned: Dict[str, str] = {}
         for field_name, field_type in fields.items():
             if not isinstance(field_name, str) or not field_name:
                 raise ValueError(f"invalid field name in {model_name}")
             _require_ident(field_name, what=f"field name in {model_name}")
             if not isinstance(field_type, str):
                 raise ValueError(f"invalid field type in {model_name}.{field_name}")
-            if field_type not in ALLOWED_TYPES and not _is_ref_type(field_type):
+            field_name = _intern(field_name)
+            field_type = _intern(field_type)
+            interned[field_name] = field_type
+            target = _ref_target_or_none(field_type)
+            if target is None and field_type not in ALLOWED_TYPES:
                 raise ValueError(
                     f"invalid field type '{field_type}' in {model_name} (allowed: {sorted(ALLOWED_TYPES)} or ref:<Model>)"
                 )
-            if _is_ref_type(field_type):
-                target = _ref_target(field_type)
-                if target not in model_names:
-                    raise ValueError(f"ref target '{target}' not found for {model_name}.{field_name}")
-        models.append(ModelSpec(name=model_name, fields=fields))
-
-    api = spec.get("api", {}) or {}
-    if not isinstance(api, dict):
-        raise ValueError("api must be an object")
+            if target is not None:
+                refs.append((model_name, field_name, target))
+        models.append(ModelSpec(name=model_name, fields=interned))
+
+    model_names = frozenset(names)
+    model_fields_by_name: Dict[str, frozenset[str]] = {m.name: m.field_names for m in models}
+    for model_name, field_name, target in refs:
+        if target not in model_names:
+            raise ValueError(f"ref target '{target}' not found for {model_name}.{field_name}")
+
+    api = _get_obj(spec, "api", what="api")
     crud = api.get("crud", []) or []
-    if not isinstance(crud, list) or not all(isinstance(c, str) for c in crud):
+    if not _is_str_list(crud):
         raise ValueError("api.crud must be list of strings")
     for c in crud:
         if c not in model_names:
             raise ValueError(f"api.crud references unknown model: {c}")
 
-    actions_raw = api.get("actions", []) or []
-    if not isinstance(actions_raw, list):
-        raise ValueError("api.actions must be a list")
-    hooks_raw = api.get("hooks", []) or []
-    if not isinstance(hooks_raw, list):
-        raise ValueError("api.hooks must be a list")
-
-    ui = spec.get("ui", {}) or {}
-    if not isinstance(ui, dict):
-        raise ValueError("ui must be an object")
-    pages_raw = ui.get("pages", []) or []
-    if not isinstance(pages_raw, list):
-        raise ValueError("ui.pages must be a list")
+    actions_raw = _get_list(api, "actions", what="api.actions")
+    hooks_raw = _get_list(api, "hooks", what="api.hooks")
+
+    ui = _get_obj(spec, "ui", what="ui")
+    pages_raw = _get_list(ui, "pages", what="ui.pages")
     admin_enabled = bool(ui.get("admin", False))
     admin_path = ui.get("admin_path", "/admin")
     if not isinstance(admin_path, str) or not admin_path.startswith("/"):
@@ -408,7 +876,7 @@ def validate_spec(spec: Dict[str, Any]) -> AppSpec:
         if not isinstance(theme, dict):
             raise ValueError("ui.theme must be an object")
         css_urls = theme.get("css_urls", []) or []
-        if not isinstance(css_urls, list) or not all(isinstance(u, str) for u in css_urls):
+        if not _is_str_list(css_urls):
             raise ValueError("ui.theme.css_urls must be a list of strings")
         for raw_url in css_urls:
             url = raw_url.strip()
@@ -417,8 +885,7 @@ def validate_spec(spec: Dict[str, Any]) -> AppSpec:
             if url.startswith("/"):
                 theme_css_urls.append(url)
                 continue
-            parsed = urlparse(url)
-            if parsed.scheme != "https" or not parsed.netloc:
+            if not _is_https_url(url):
                 raise ValueError("ui.theme.css_urls entries must be https://... or /path")
             theme_css_urls.append(url)
 
@@ -427,15 +894,13 @@ def validate_spec(spec: Dict[str, Any]) -> AppSpec:
             raise ValueError("ui.theme.tailwind_config must be an object")
         theme_tailwind_config = tailwind
 
-        classes = theme.get("classes", {}) or {}
-        if not isinstance(classes, dict):
-            raise ValueError("ui.theme.classes must be an object")
+        classes = _get_obj(theme, "classes", what="ui.theme.classes")
         for key, value in classes.items():
             if not isinstance(key, str) or not key:
                 raise ValueError("ui.theme.classes keys must be non-empty strings")
             if not isinstance(value, str):
                 raise ValueError("ui.theme.classes values must be strings")
-        theme_classes = {str(k): str(v) for k, v in classes.items()}
+        theme_classes = _share_strings(classes, strings)
 
     pages: List[PageSpec] = []
     for page in pages_raw:
@@ -452,7 +917,7 @@ def validate_spec(spec: Dict[str, Any]) -> AppSpec:
             raise ValueError("page.title must be string")
         fields = page.get("fields")
         if fields is not None:
-            if not isinstance(fields, list) or not all(isinstance(f, str) for f in fields):
+            if not _is_str_list(fields):
                 raise ValueError("page.fields must be list of strings")
         default_query = page.get("default_query")
         if default_query is not None and not isinstance(default_query, str):
@@ -475,38 +940,34 @@ def validate_spec(spec: Dict[str, Any]) -> AppSpec:
                     raise ValueError("page.default_filters values must be string/number/bool")
         visible_fields = page.get("visible_fields")
         if visible_fields is not None:
-            if not isinstance(visible_fields, list) or not all(isinstance(f, str) for f in visible_fields):
+            if not _is_str_list(visible_fields):
                 raise ValueError("page.visible_fields must be list of strings")
         hidden_fields = page.get("hidden_fields")
         if hidden_fields is not None:
-            if not isinstance(hidden_fields, list) or not all(isinstance(f, str) for f in hidden_fields):
+            if not _is_str_list(hidden_fields):
                 raise ValueError("page.hidden_fields must be list of strings")
 
         # Validate per-model field references
-        model_fields = None
-        for m in models:
-            if m.name == model:
-                model_fields = set(m.fields.keys())
-                break
+        model_fields = model_fields_by_name.get(model)
         if model_fields:
             if fields:
-                for field_name in fields:
-                    if field_name not in model_fields:
-                        raise ValueError(f"page.fields contains unknown field '{field_name}' for {model}")
+                unknown = _first_unknown(fields, model_fields)
+                if unknown is not None:
+                    raise ValueError(f"page.fields contains unknown field '{unknown}' for {model}")
             if default_sort and default_sort != "id" and default_sort not in model_fields:
                 raise ValueError(f"page.default_sort unknown field '{default_sort}' for {model}")
             if default_filters:
-                for field_name in default_filters.keys():
-                    if field_name not in model_fields:
-                        raise ValueError(f"page.default_filters unknown field '{field_name}' for {model}")
+                unknown = _first_unknown(default_filters.keys(), model_fields)
+                if unknown is not None:
+                    raise ValueError(f"page.default_filters unknown field '{unknown}' for {model}")
             if visible_fields:
-                for field_name in visible_fields:
-                    if field_name not in model_fields:
-                        raise ValueError(f"page.visible_fields unknown field '{field_name}' for {model}")
+                unknown = _first_unknown(visible_fields, model_fields)
+                if unknown is not None:
+                    raise ValueError(f"page.visible_fields unknown field '{unknown}' for {model}")
             if hidden_fields:
-                for field_name in hidden_fields:
-                    if field_name not in model_fields:
-                        raise ValueError(f"page.hidden_fields unknown field '{field_name}' for {model}")
+                unknown = _first_unknown(hidden_fields, model_fields)
+                if unknown is not None:
+                    raise ValueError(f"page.hidden_fields unknown field '{unknown}' for {model}")
 
         pages.append(
             PageSpec(
@@ -517,13 +978,14 @@ def validate_spec(spec: Dict[str, Any]) -> AppSpec:
                 default_query=default_query,
                 default_sort=default_sort,
                 default_dir=default_dir.lower() if isinstance(default_dir, str) else None,
-                default_filters={k: str(v) for k, v in default_filters.items()} if default_filters else None,
+                default_filters=_share_strings(default_filters, strings) if default_filters else None,
                 visible_fields=visible_fields,
                 hidden_fields=hidden_fields,
             )
         )
 
     # Actions
+    reserved_prefixes = (_STATIC_PREFIX, admin_path + "/") if admin_path else (_STATIC_PREFIX,)
     action_names: set[str] = set()
     for raw in actions_raw:
         if not isinstance(raw, dict):
@@ -549,7 +1011,7 @@ def validate_spec(spec: Dict[str, Any]) -> AppSpec:
         method = raw.get("method", "POST")
         if not isinstance(method, str) or method.upper() not in ALLOWED_ACTION_METHODS:
             raise ValueError(f"action.method must be one of {sorted(ALLOWED_ACTION_METHODS)}")
-        method = method.upper()
+        method = sys.intern(method.upper())
         path = raw.get("path") or f"/api/actions/{action_name}"
         if not isinstance(path, str) or not path.startswith("/"):
             raise ValueError("action.path must be a string starting with /")
@@ -558,291 +1020,27 @@ def validate_spec(spec: Dict[str, Any]) -> AppSpec:
             raise ValueError(f"action.auth must be one of {sorted(ALLOWED_ACTION_AUTH)}")
 
         # Avoid accidental collisions with admin/static and CRUD endpoints.
-        if path.startswith("/static/"):
-            raise ValueError("action.path cannot be under /static/")
-        if admin_path and (path == admin_path or path.startswith(admin_path + "/")):
+        if path.startswith(reserved_prefixes) or (admin_path and path == admin_path):
+            if path.startswith(_STATIC_PREFIX):
+                raise ValueError("action.path cannot be under /static/")
             raise ValueError("action.path cannot be under ui.admin_path")
-        for model_name in model_names:
-            base = f"/api/{model_name}"
-            if path == base or path.startswith(base + "/"):
-                raise ValueError(f"action.path collides with CRUD path for model '{model_name}': {path}")
-
-        http_spec = None
-        llm_spec = None
-        db_spec = None
-        value_spec = None
-        flow_spec = None
-        if kind == "http":
-            http_raw = raw.get("http", raw.get("request")) or raw.get("http_request") or {}
-            if not isinstance(http_raw, dict):
-                raise ValueError("action.http must be an object")
-            url = http_raw.get("url") or raw.get("url")
-            if not isinstance(url, str) or not url:
-                raise ValueError("action.http.url must be a string")
-            headers = http_raw.get("headers") or {}
-            if not isinstance(headers, dict) or not all(
-                isinstance(k, str) and isinstance(v, str) for k, v in headers.items()
-            ):
-                raise ValueError("action.http.headers must be an object of string:string")
-            body = http_raw.get("body", None)
-            timeout_s = http_raw.get("timeout_s", 30)
-            retries = http_raw.get("retries", 0)
-            expect = http_raw.get("expect", "auto")
-            if not isinstance(timeout_s, int) or timeout_s < 1:
-                raise ValueError("action.http.timeout_s must be an int >= 1")
-            if not isinstance(retries, int) or retries < 0 or retries > 10:
-                raise ValueError("action.http.retries must be an int between 0 and 10")
-            if not isinstance(expect, str) or expect not in ("auto", "json", "text"):
-                raise ValueError("action.http.expect must be 'auto', 'json', or 'text'")
-            http_method = http_raw.get("method")
-            if http_method is not None:
-                if not isinstance(http_method, str) or http_method.upper() not in ALLOWED_ACTION_METHODS:
-                    raise ValueError(f"action.http.method must be one of {sorted(ALLOWED_ACTION_METHODS)}")
-                http_method = http_method.upper()
-            http_spec = HttpActionSpec(
-                url=url,
-                method=http_method,
-                headers=headers,
-                body=body,
-                timeout_s=timeout_s,
-                retries=retries,
-                expect=expect,
-            )
-        elif kind == "llm":
-            llm_raw = raw.get("llm") or {}
-            if not isinstance(llm_raw, dict):
-                raise ValueError("action.llm must be an object")
-            provider = llm_raw.get("provider", "openai")
-            if not isinstance(provider, str) or provider.lower() not in ("openai", "ollama"):
-                raise ValueError("action.llm.provider must be 'openai' or 'ollama'")
-            base_url = llm_raw.get("base_url")
-            if base_url is not None and not isinstance(base_url, str):
-                raise ValueError("action.llm.base_url must be a string")
-            model = llm_raw.get("model")
-            if model is not None and not isinstance(model, str):
-                raise ValueError("action.llm.model must be a string")
-            api_key_env = llm_raw.get("api_key_env", "VIBEWEB_AI_API_KEY")
-            if not isinstance(api_key_env, str) or not api_key_env:
-                raise ValueError("action.llm.api_key_env must be a string")
-            messages = llm_raw.get("messages") or []
-            if not isinstance(messages, list):
-                raise ValueError("action.llm.messages must be a list")
-            for msg in messages:
-                if not isinstance(msg, dict):
-                    raise ValueError("action.llm.messages items must be objects")
-                role = msg.get("role")
-                content = msg.get("content")
-                if role not in ("system", "user", "assistant"):
-                    raise ValueError("action.llm.messages.role must be system|user|assistant")
-                if not isinstance(content, str):
-                    raise ValueError("action.llm.messages.content must be a string")
-            temperature = llm_raw.get("temperature", 0.2)
-            if not isinstance(temperature, (int, float)) or temperature < 0 or temperature > 2:
-                raise ValueError("action.llm.temperature must be between 0 and 2")
-            max_tokens = llm_raw.get("max_tokens")
-            if max_tokens is not None:
-                if not isinstance(max_tokens, int) or max_tokens < 1:
-                    raise ValueError("action.llm.max_tokens must be int >= 1")
-            timeout_s = llm_raw.get("timeout_s", 60)
-            retries = llm_raw.get("retries", 0)
-            output = llm_raw.get("output", "text")
-            if not isinstance(timeout_s, int) or timeout_s < 1:
-                raise ValueError("action.llm.timeout_s must be an int >= 1")
-            if not isinstance(retries, int) or retries < 0 or retries > 10:
-                raise ValueError("action.llm.retries must be an int between 0 and 10")
-            if not isinstance(output, str) or output not in ("text", "json"):
-                raise ValueError("action.llm.output must be 'text' or 'json'")
-            llm_spec = LlmActionSpec(
-                provider=provider.lower(),
-                base_url=base_url,
-                model=model,
-                api_key_env=api_key_env,
-                messages=messages,
-                temperature=float(temperature),
-                max_tokens=max_tokens,
-                timeout_s=timeout_s,
-                retries=retries,
-                output=output,
-            )
-        elif kind == "db":
-            db_raw = raw.get("db") or {}
-            if not isinstance(db_raw, dict):
-                raise ValueError("action.db must be an object")
-            op = db_raw.get("op")
-            if not isinstance(op, str) or op not in ALLOWED_DB_OPS:
-                raise ValueError(f"action.db.op must be one of {sorted(ALLOWED_DB_OPS)}")
-            db_model = db_raw.get("model")
-            if not isinstance(db_model, str) or db_model not in model_names:
-                raise ValueError("action.db.model must reference a known model")
-
-            model_fields = None
-            for m in models:
-                if m.name == db_model:
-                    model_fields = set(m.fields.keys())
-                    break
-
-            def _validate_field_dict(value: Any, label: str) -> Dict[str, Any]:
-                if not isinstance(value, dict):
-                    raise ValueError(f"action.db.{label} must be an object")
-                if model_fields:
-                    for key in value.keys():
-                        if key not in model_fields:
-                            raise ValueError(f"action.db.{label} contains unknown field '{key}' for {db_model}")
-                return value  # type: ignore[return-value]
-
-            row_id = db_raw.get("id")
-            data = db_raw.get("data")
-            patch = db_raw.get("patch")
-            limit = int(db_raw.get("limit", 100))
-            offset = int(db_raw.get("offset", 0))
-            order_by = db_raw.get("order_by")
-            if order_by is not None and not isinstance(order_by, str):
-                raise ValueError("action.db.order_by must be a string")
-            if limit < 1 or limit > 1000:
-                raise ValueError("action.db.limit must be between 1 and 1000")
-            if offset < 0:
-                raise ValueError("action.db.offset must be >= 0")
-
-            if op == "insert":
-                if data is None:
-                    raise ValueError("action.db.data is required for op=insert")
-                data = _validate_field_dict(data, "data")
-                if not data:
-                    raise ValueError("action.db.data must include at least one field")
-            elif op == "update":
-                if row_id is None or not isinstance(row_id, (str, int)):
-                    raise ValueError("action.db.id is required for op=update (string or int)")
-                if patch is None:
-                    raise ValueError("action.db.patch is required for op=update")
-                patch = _validate_field_dict(patch, "patch")
-            elif op in ("get", "delete"):
-                if row_id is None or not isinstance(row_id, (str, int)):
-                    raise ValueError(f"action.db.id is required for op={op} (string or int)")
-            elif op == "list":
-                pass
-
-            db_spec = DbActionSpec(
-                op=op,
-                model=db_model,
-                id=row_id,
-                data=data if isinstance(data, dict) else None,
-                patch=patch if isinstance(patch, dict) else None,
-                limit=limit,
-                offset=offset,
-                order_by=order_by,
-            )
-        elif kind == "value":
-            value_raw = raw.get("value")
-            if not isinstance(value_raw, dict):
-                raise ValueError("action.value must be an object")
-            if "data" not in value_raw:
-                raise ValueError("action.value.data is required (can be null)")
-            status = value_raw.get("status", 200)
-            ok = value_raw.get("ok", True)
-            if not isinstance(status, int) or status < 100 or status > 599:
-                raise ValueError("action.value.status must be an int between 100 and 599")
-            if not isinstance(ok, bool):
-                raise ValueError("action.value.ok must be a boolean")
-            value_spec = ValueActionSpec(
-                data=value_raw.get("data"),
-                status=int(status),
-                ok=bool(ok),
-            )
-        elif kind == "flow":
-            flow_raw = raw.get("flow") or {}
-            if not isinstance(flow_raw, dict):
-                raise ValueError("action.flow must be an object")
-            flow_vars = flow_raw.get("vars")
-            if flow_vars is not None:
-                if not isinstance(flow_vars, dict):
-                    raise ValueError("action.flow.vars must be an object")
-                for key in flow_vars.keys():
-                    if not isinstance(key, str) or not key:
-                        raise ValueError("action.flow.vars keys must be strings")
-                    _require_ident(key, what="flow vars key")
-            steps_raw = flow_raw.get("steps") or []
-            if not isinstance(steps_raw, list) or not steps_raw:
-                raise ValueError("action.flow.steps must be a non-empty list")
-            steps: List[FlowStepSpec] = []
-            step_ids: set[str] = set()
-            for step_raw in steps_raw:
-                if not isinstance(step_raw, dict):
-                    raise ValueError("flow step must be an object")
-                step_id = step_raw.get("id")
-                if not isinstance(step_id, str) or not step_id:
-                    raise ValueError("flow step.id must be a string")
-                _require_ident(step_id, what="flow step.id")
-                if step_id in step_ids:
-                    raise ValueError(f"duplicate flow step id: {step_id}")
-                step_ids.add(step_id)
-                use = step_raw.get("use")
-                if not isinstance(use, str) or not use:
-                    raise ValueError("flow step.use must be a string")
-                if use == action_name:
-                    raise ValueError("flow step.use cannot reference the flow action itself")
-                if use not in action_names:
-                    raise ValueError(f"flow step.use references unknown action: {use}")
-                when = step_raw.get("when")
-                if when is not None:
-                    _validate_condition(when, what="flow step.when")
-
-                step_retries = step_raw.get("retries", 0)
-                if not isinstance(step_retries, int) or step_retries < 0 or step_retries > 10:
-                    raise ValueError("flow step.retries must be an int between 0 and 10")
-                step_timeout = step_raw.get("timeout_s")
-                if step_timeout is not None:
-                    if not isinstance(step_timeout, int) or step_timeout < 1:
-                        raise ValueError("flow step.timeout_s must be an int >= 1")
-                step_parallel = step_raw.get("parallel", False)
-                if not isinstance(step_parallel, bool):
-                    raise ValueError("flow step.parallel must be a boolean")
-
-                on_error = step_raw.get("on_error")
-                if on_error is not None:
-                    if not isinstance(on_error, str) or on_error not in ("stop", "continue", "return"):
-                        raise ValueError("flow step.on_error must be one of: stop, continue, return")
-
-                set_raw = step_raw.get("set")
-                if set_raw is not None:
-                    if not isinstance(set_raw, dict):
-                        raise ValueError("flow step.set must be an object")
-                    for key in set_raw.keys():
-                        if not isinstance(key, str) or not key:
-                            raise ValueError("flow step.set keys must be strings")
-                        _require_ident(key, what="flow step.set key")
-                steps.append(
-                    FlowStepSpec(
-                        id=step_id,
-                        use=use,
-                        input=step_raw.get("input"),
-                        when=when,
-                        on_error=on_error,
-                        set=set_raw,
-                        retries=int(step_retries),
-                        timeout_s=int(step_timeout) if isinstance(step_timeout, int) else None,
-                        parallel=bool(step_parallel),
-                    )
-                )
-            return_step = flow_raw.get("return_step", flow_raw.get("return"))
-            if return_step is not None:
-                if not isinstance(return_step, str) or not return_step:
-                    raise ValueError("action.flow.return_step must be a string")
-                if return_step not in step_ids:
-                    raise ValueError("action.flow.return_step must be one of flow step ids")
-            flow_spec = FlowActionSpec(steps=steps, return_step=return_step, vars=flow_vars)
+        # /api/<Model> and /api/<Model>/... belong to CRUD: one segment lookup instead of a scan per model.
+        if path.startswith("/api/"):
+            segment = path[5:].split("/", 1)[0]
+            if segment in model_names:
+                raise ValueError(f"action.path collides with CRUD path for model '{segment}': {path}")
+
+        ctx = _ActionContext(action_name, action_names, model_names, model_fields_by_name, strings)
+        sub_spec = _ACTION_VALIDATORS[kind](raw, ctx)
 
         actions.append(
             ActionSpec(
-                name=action_name,
-                kind=kind,
+                name=_intern(action_name),
+                kind=_intern(kind),
                 method=method,
                 path=path,
-                auth=auth,
-                http=http_spec,
-                llm=llm_spec,
-                db=db_spec,
-                value=value_spec,
-                flow=flow_spec,
+                auth=_intern(auth),
+                **{kind: sub_spec},
             )
         )
 
@@ -863,41 +1061,27 @@ def validate_spec(spec: Dict[str, Any]) -> AppSpec:
         mode = raw.get("mode", "async")
         if not isinstance(mode, str) or mode not in ALLOWED_HOOK_MODES:
             raise ValueError(f"hook.mode must be one of {sorted(ALLOWED_HOOK_MODES)}")
+        model_fields = model_fields_by_name.get(hook_model)
         writeback = raw.get("writeback")
         if writeback is not None:
-            if not isinstance(writeback, list) or not all(isinstance(f, str) for f in writeback):
+            if not _is_str_list(writeback):
                 raise ValueError("hook.writeback must be list of strings")
-            model_fields = None
-            for m in models:
-                if m.name == hook_model:
-                    model_fields = set(m.fields.keys())
-                    break
             if model_fields:
-                for field_name in writeback:
-                    if field_name not in model_fields:
-                        raise ValueError(f"hook.writeback unknown field '{field_name}' for {hook_model}")
+                unknown = _first_unknown(writeback, model_fields)
+                if unknown is not None:
+                    raise ValueError(f"hook.writeback unknown field '{unknown}' for {hook_model}")
 
         when_changed = raw.get("when_changed")
         if when_changed is not None:
-            if not isinstance(when_changed, list) or not all(isinstance(f, str) for f in when_changed):
+            if not _is_str_list(when_changed):
                 raise ValueError("hook.when_changed must be list of strings")
-            model_fields = None
-            for m in models:
-                if m.name == hook_model:
-                    model_fields = set(m.fields.keys())
-                    break
             if model_fields:
-                for field_name in when_changed:
-                    if field_name not in model_fields:
-                        raise ValueError(f"hook.when_changed unknown field '{field_name}' for {hook_model}")
+                unknown = _first_unknown(when_changed, model_fields)
+                if unknown is not None:
+                    raise ValueError(f"hook.when_changed unknown field '{unknown}' for {hook_model}")
 
         when = raw.get("when")
         if when is not None:
-            model_fields = None
-            for m in models:
-                if m.name == hook_model:
-                    model_fields = set(m.fields.keys())
-                    break
             if isinstance(when, dict) and not _is_op_condition(when):
                 for key in when.keys():
                     if not isinstance(key, str):
@@ -910,10 +1094,10 @@ def validate_spec(spec: Dict[str, Any]) -> AppSpec:
                 _validate_condition(when, what="hook.when")
         hooks.append(
             HookSpec(
-                model=hook_model,
-                event=event,
-                action=action_name,
-                mode=mode,
+                model=_intern(hook_model),
+                event=_intern(event),
+                action=_intern(action_name),
+                mode=_intern(mode),
                 writeback=writeback,
                 when_changed=when_changed,
                 when=when,
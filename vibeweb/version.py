@@ -1,7 +1,6 @@
 from __future__ import annotations
 
-import importlib.metadata
-import re
+import functools
 from pathlib import Path
 
 _DISTRIBUTION_NAME = "vibepy"
@@ -24,7 +23,8 @@ def _read_pyproject_version(pyproject: Path) -> str | None:
     if tomllib is None:
         return _read_pyproject_version_regex(pyproject)
     try:
-        data = tomllib.loads(pyproject.read_text(encoding="utf-8"))
+        with pyproject.open("rb") as f:
+            data = tomllib.load(f)
     except Exception:
         return None
     project = data.get("project")
@@ -35,10 +35,10 @@ def _read_pyproject_version(pyproject: Path) -> str | None:
     return None
 
 
-# Note: keep these regexes simple and readable. This file is used both in
+# Note: keep this regex simple and readable. This file is used both in
 # installed mode and repo-checkout mode, so it should be boring and reliable.
-_SECTION_RE = re.compile(r"^\s*\[(?P<section>[^\]]+)\]\s*$")
-_VERSION_RE = re.compile(r"^\s*version\s*=\s*([\"'])(?P<version>[^\"']+)\1\s*$")
+# Matched with re's own pattern cache; `re` is imported only by the Python 3.10 fallback below.
+_VERSION_PATTERN = r"^\s*version\s*=\s*([\"'])(?P<version>[^\"']+)\1\s*$"
 
 
 def _read_pyproject_version_regex(pyproject: Path) -> str | None:
@@ -47,6 +47,8 @@ def _read_pyproject_version_regex(pyproject: Path) -> str | None:
 
     This is intentionally narrow: we only look for `[project]` then `version = "..."`.
     """
+    import re
+
     try:
         text = pyproject.read_text(encoding="utf-8")
     except Exception:
@@ -57,26 +59,32 @@ def _read_pyproject_version_regex(pyproject: Path) -> str | None:
         line = raw_line.strip()
         if not line or line.startswith("#"):
             continue
-        sec = _SECTION_RE.match(line)
-        if sec:
-            in_project = sec.group("section").strip() == "project"
+        # Section headers are `[name]` with no `]` inside (so `[[array.tables]]` is not one).
+        if line[0] == "[" and line[-1] == "]" and len(line) > 2 and "]" not in line[1:-1]:
+            in_project = line[1:-1].strip() == "project"
             continue
-        if not in_project:
+        if not in_project or not line.startswith("version"):
             continue
-        m = _VERSION_RE.match(raw_line)
+        m = re.match(_VERSION_PATTERN, raw_line)
         if m:
             version = m.group("version").strip()
             return version if version else None
     return None
 
 
+@functools.lru_cache(maxsize=1)
 def get_version() -> str:
     """
     Best-effort version lookup.
 
     1) When installed, prefer the installed distribution metadata.
     2) When running from a repo checkout, read [project].version from pyproject.toml.
+
+    Computed once per process (vibeweb, vibelang and the CLI all ask at import time).
     """
+    # Imported here: importlib.metadata costs tens of ms to import and is needed only once.
+    import importlib.metadata
+
     try:
         return importlib.metadata.version(_DISTRIBUTION_NAME)
     except Exception: